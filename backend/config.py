@@ -1,10 +1,20 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import FrozenSet, Tuple
 
 
 class Settings(BaseSettings):
     """Application settings"""
 
+    # Immutable once loaded: the cached instance is shared across the process,
+    # and defaults are trusted as-is instead of being re-validated
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        frozen=True,
+        validate_default=False,
+        extra="ignore",
+    )
+
     # API Keys
     GEMINI_API_KEY: str = ""  # Optional: users can provide via frontend
 
@@ -13,17 +23,17 @@ class Settings(BaseSettings):
     PORT: int = 8000
 
     # CORS
-    CORS_ORIGINS: List[str] = [
+    CORS_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://127.0.0.1:3000",
         "http://localhost:3001",
         "http://localhost:3002",
         "http://127.0.0.1:3001",
         "http://127.0.0.1:3002"
-    ]
+    )
 
     # Logging
-    LOG_LEVEL: str = "DEBUG"  # Set to DEBUG to see function calling details
+    LOG_LEVEL: str = "INFO"  # Set to DEBUG to see function calling details
 
     # ================================================================
     # BRANDING & CUSTOMIZATION
@@ -56,9 +66,53 @@ class Settings(BaseSettings):
     # Session log files (per voice session)
     ENABLE_SESSION_LOGS: bool = True
     SESSION_LOG_PATH: str = "./session_logs"
+    # Write session logs as length-prefixed msgpack (.mpk, needs msgpack)
+    # instead of NDJSON; decode with read_log.py
+    SESSION_LOG_BINARY: bool = False
+
+    # ================================================================
+    # STREAMING
+    # ================================================================
+
+    # Max audio chunks buffered from Gemini toward the frontend; when full,
+    # the Gemini receiver waits (backpressure) instead of growing memory
+    AUDIO_IN_QUEUE_MAX: int = 64
+
+    # Pack audio chunks already queued for the frontend into one binary
+    # frame (fewer sends, slightly burstier playback); off by default
+    COALESCE_AUDIO: bool = False
+
+    # Max queued microphone frames merged into one send to Gemini; small
+    # batches keep Gemini's pause detection unchanged. 1 disables merging
+    GEMINI_SEND_COALESCE: int = 2
+
+    # Warn when a session runs on the default asyncio loop instead of uvloop
+    # (catches deployments that lost --loop uvloop / uvicorn[standard])
+    EXPECT_UVLOOP: bool = False
+
+    # ================================================================
+    # MOCK SERVICES
+    # ================================================================
+
+    # Simulated round-trip latency for the mock EMR/insurance/notification
+    # services; set to 0 for benchmarks and fast test runs
+    MOCK_LATENCY_MS: int = 100
+
+    # Max concurrent in-flight calls per service (stands in for a
+    # downstream connection pool)
+    SERVICE_POOL_SIZE: int = 32
+
+    @cached_property
+    def CORS_ORIGINS_SET(self) -> FrozenSet[str]:
+        """CORS_ORIGINS as a frozenset for O(1) origin membership checks"""
+        return frozenset(self.CORS_ORIGINS)
+
 
-    class Config:
-        env_file = ".env"
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parsed from .env only once)"""
+    return Settings()
 
 
-settings = Settings()
+# Backward-compatible module attribute; prefer get_settings() in new code
+settings = get_settings()
@@ -12,11 +12,11 @@ Based on Google's official AudioLoop pattern from Get_started_LiveAPI.py
     Frontend WebSocket
         ↕ (audio + control messages)
     Async Task Group (5 concurrent tasks)
-        ├─ _receive_from_frontend()    → Captures audio from frontend
+        ├─ _receive_from_frontend()     → Captures audio from frontend
         ├─ _send_to_gemini()            → Forwards audio to Gemini
         ├─ _receive_from_gemini()       → Receives AI responses
-        ├─ _send_to_frontend()          → Sends responses to frontend
-        └─ _extract_medical_data()      → Periodically extracts structured data
+        ├─ _send_audio_to_frontend()    → Streams AI audio to frontend
+        └─ _send_control_to_frontend()  → Sends transcripts/events to frontend
     Gemini Live API
 
 Key Features:
@@ -38,36 +38,80 @@ https://ai.google.dev/gemini-api/docs/live
 """
 
 import asyncio
+import io
 import logging
-import json
 import os
-import inspect
+import struct
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from google import genai
-from google.genai import types
-from google.genai import live as live_module
+from collections import Counter, deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Final, Optional, Dict, Any, List
+
+import orjson
+from fastapi import WebSocketDisconnect
+
+try:  # Optional: compact binary session logs (settings.SESSION_LOG_BINARY)
+    import msgpack
+except ImportError:  # pragma: no cover - JSON logs are the default
+    msgpack = None
 
 from schemas import MedicalIntake
-from config import settings
+from config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# google-genai (protobufs + websockets stack) is imported on first session,
+# not at module import - see _ensure_genai()
+genai = None
+types = None
+live_module = None
+
+
+def _ensure_genai() -> None:
+    """Import google-genai on first use and apply the websockets compat patch."""
+    global genai, types, live_module
+    if genai is not None:
+        return
+
+    from google import genai as _genai
+    from google.genai import types as _types
+    from google.genai import live as _live_module
+
+    types = _types
+    live_module = _live_module
+    _patch_websockets_for_headers()
+    genai = _genai  # assigned last: marks initialization as complete
+
 
 def _patch_websockets_for_headers() -> None:
-    """google-genai expects websockets to accept additional_headers kwarg."""
+    """google-genai expects websockets to accept additional_headers kwarg.
+
+    Runs at most once per process: the outcome is recorded on the live module
+    so re-imports and reloads skip the signature introspection entirely.
+    """
+    if getattr(live_module, "_gemini_headers_patched", False):
+        return
+    live_module._gemini_headers_patched = True  # type: ignore[attr-defined]
 
     target = getattr(live_module, "ws_connect", None)
-    if target is None:
+    if target is None or getattr(target, "_patched", False):
         return
 
-    try:
-        sig = inspect.signature(target)
-    except (TypeError, ValueError):
+    # Read the parameter names straight off the code object instead of
+    # building an inspect.Signature (websockets >= 13 exposes connect as a class)
+    code = getattr(target, "__code__", None) or getattr(
+        getattr(target, "__init__", None), "__code__", None
+    )
+    if code is None:
         return
 
-    if "additional_headers" in sig.parameters:
+    param_names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    if "additional_headers" in param_names:
         return
 
     def connect_wrapper(*args, additional_headers=None, **kwargs):  # type: ignore[override]
@@ -75,10 +119,54 @@ def _patch_websockets_for_headers() -> None:
             kwargs["extra_headers"] = additional_headers
         return target(*args, **kwargs)
 
+    connect_wrapper._patched = True  # type: ignore[attr-defined]
     live_module.ws_connect = connect_wrapper  # type: ignore[assignment]
 
 
-_patch_websockets_for_headers()
+def _new_client(api_key: str):
+    """Create a genai.Client configured for the Live API (v1beta)."""
+    _ensure_genai()
+    return genai.Client(
+        http_options={"api_version": "v1beta"},
+        api_key=api_key
+    )
+
+
+@lru_cache(maxsize=1)
+def get_shared_client(api_key: str):
+    """Process-wide genai.Client for the server's own API key.
+
+    Sessions using settings.GEMINI_API_KEY share one client (and its HTTP
+    connection pool for extraction calls) instead of building one per
+    connection. Keys supplied by a frontend get their own client.
+    """
+    return _new_client(api_key)
+
+
+async def _run_fail_fast(tasks: List["asyncio.Task"]) -> None:
+    """Run session tasks until the first one exits, then cancel the rest.
+
+    Every session task is an endless loop, so any task finishing - by error,
+    by end_session's CancelledError, or by returning (the frontend receiver
+    returns when the client hangs up) - means the session is over. Siblings are cancelled and awaited so none keep the Gemini
+    connection open, and the first real exception is re-raised for run().
+
+    asyncio.TaskGroup is not used: it is 3.11+, and it treats a child's
+    CancelledError (how end_session stops the receiver) as a clean exit
+    while leaving the other tasks running.
+    """
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Also runs when run() itself is cancelled mid-wait
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
 
 # ============================================================================
 # AUDIO CONFIGURATION
@@ -86,17 +174,306 @@ _patch_websockets_for_headers()
 # These settings match Google's official Live API requirements
 # and are optimized for speech recognition and generation
 
-FORMAT = "pcm"                  # PCM (Pulse Code Modulation) audio format
-CHANNELS = 1                    # Mono audio (single channel)
-SEND_SAMPLE_RATE = 16000       # 16kHz - Standard for speech input
-RECEIVE_SAMPLE_RATE = 24000    # 24kHz - Higher quality for AI output
+FORMAT: Final[str] = "pcm"             # PCM (Pulse Code Modulation) audio format
+CHANNELS: Final[int] = 1               # Mono audio (single channel)
+SEND_SAMPLE_RATE: Final[int] = 16000   # 16kHz - Standard for speech input
+RECEIVE_SAMPLE_RATE: Final[int] = 24000  # 24kHz - Higher quality for AI output
+
+# MIME type for every uplink chunk - formatted once, reused for each frame
+_AUDIO_MIME: Final[str] = f"audio/{FORMAT};rate={SEND_SAMPLE_RATE}"
+
+# Upper bound for frames coalesced into a single session.send() (1s of audio).
+# Only frames already waiting are merged, so this bounds message size, not latency.
+_SEND_BATCH_MAX_BYTES: Final[int] = SEND_SAMPLE_RATE * CHANNELS * 2
+
+# Slots in the frontend → Gemini audio ring (~1.3s of 256 ms mic chunks)
+_AUDIO_OUT_RING_SIZE: Final[int] = 5
+
+# A put onto the frontend-bound queue that waits longer than this is a stall
+_QUEUE_STALL_SECONDS: Final[float] = 0.005
+
+# Capacity of the frontend-bound control queue (transcripts, events)
+_CONTROL_QUEUE_MAX: Final[int] = 128
+
+# control_q message tags - items are (tag, *payload) tuples
+_T_TEXT: Final[int] = 1  # (_T_TEXT, role, text)
+_T_FN: Final[int] = 2    # (_T_FN, function_name)
+_T_TURN: Final[int] = 3  # (_T_TURN,)
+
+# Coalesced audio frames (settings.COALESCE_AUDIO): one byte tag, then each
+# chunk as <uint32 little-endian length><PCM bytes>. PCM16 chunks always have
+# an even length, so the odd-length coalesced frame is unambiguous
+_AUDIO_MULTI_TAG: Final[bytes] = b"\x01"
+_AUDIO_COALESCE_MAX_CHUNKS: Final[int] = 8
+_pack_chunk_len = struct.Struct("<I").pack
+
+# Constant control messages, serialized once (sent as text frames)
+_READY_STATUS_JSON: Final[str] = orjson.dumps(
+    {"type": "status", "state": "ready", "message": "Connected to Gemini"}
+).decode()
+_TURN_COMPLETE_JSON: Final[str] = orjson.dumps({"type": "turn_complete"}).decode()
+_INTAKE_COMPLETE_JSON: Final[str] = orjson.dumps(
+    {"type": "intake_complete", "message": "Medical intake completed successfully"}
+).decode()
+
+# Session log writer: records are batched for up to _LOG_FLUSH_SECONDS (or
+# until _LOG_BATCH_MAX are waiting) per write+flush; beyond _LOG_QUEUE_MAX
+# pending records new ones are dropped rather than stalling the session
+_LOG_QUEUE_MAX: Final[int] = 10000
+_LOG_BATCH_MAX: Final[int] = 100
+_LOG_FLUSH_SECONDS: Final[float] = 0.25
+_LOG_BUFFER_BYTES: Final[int] = 64 * 1024
+
+# Streaming transcription chunks are buffered per role and sent as one
+# transcript message once no new chunk arrived for this long...
+_TRANSCRIPT_DEBOUNCE_SECONDS: Final[float] = 0.05
+# ...or as soon as a chunk ends a sentence
+_SENTENCE_END: Final[tuple] = (".", "?", "!")
 
 # ============================================================================
 # GEMINI MODELS
 # ============================================================================
 
-MODEL = "models/gemini-2.5-flash-native-audio-preview-09-2025"            # Live API model for conversation
-SUMMARY_MODEL = "models/gemini-2.0-flash-exp"    # Model for data extraction (NOT audio model)
+MODEL: Final[str] = "models/gemini-2.5-flash-native-audio-preview-09-2025"  # Live API model for conversation
+SUMMARY_MODEL: Final[str] = "models/gemini-2.0-flash-exp"    # Model for data extraction (NOT audio model)
+
+
+# "YYYY-MM-DDTHH:MM:SS" for the current UTC second, recomputed once per second
+_ts_second = -1
+_ts_prefix = ""
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a "Z" suffix.
+
+    Same format as datetime.utcnow().isoformat() + "Z", but only the
+    fractional part is formatted per call; the date/time prefix is cached
+    for the current second.
+    """
+    global _ts_second, _ts_prefix
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if second != _ts_second:
+        _ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_second = second
+    return f"{_ts_prefix}.{nanos // 1000:06d}Z"
+
+
+def _encode_log_json(record: Dict[str, Any]) -> bytes:
+    """One NDJSON line (default session log format)."""
+    # orjson returns UTF-8 bytes directly - no str round-trip
+    return orjson.dumps(record) + b"\n"
+
+
+def _encode_log_msgpack(record: Dict[str, Any]) -> bytes:
+    """One msgpack record behind a 4-byte big-endian length (see read_log.py)."""
+    packed = msgpack.packb(record, use_bin_type=True)
+    return len(packed).to_bytes(4, "big") + packed
+
+
+def _drain_queue(queue: asyncio.Queue) -> None:
+    """Discard everything in an asyncio.Queue in one step.
+
+    Clears the queue's internal deque and wakes producers blocked on a full
+    queue (the Gemini receiver under backpressure). Waiting consumers are
+    left alone: the queue is empty, which is exactly what they wait on.
+    Falls back to a get_nowait() loop if the private layout is different.
+    """
+    items = getattr(queue, "_queue", None)
+    putters = getattr(queue, "_putters", None)
+    if items is None or putters is None:
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+    dropped = len(items)
+    items.clear()
+    # Mirror task_done() for the dropped items so join() cannot hang
+    unfinished = getattr(queue, "_unfinished_tasks", None)
+    if unfinished is not None:
+        queue._unfinished_tasks = max(0, unfinished - dropped)
+        if queue._unfinished_tasks == 0:
+            queue._finished.set()
+    # One freed slot per waiting producer, as get_nowait() would do
+    while putters:
+        waiter = putters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+
+
+# ============================================================================
+# PROMPTS
+# ============================================================================
+
+# Transcript line prefix per conversation role (instead of role.capitalize())
+_ROLE_PREFIX: Final[Dict[str, str]] = {"assistant": "Assistant: ", "patient": "Patient: "}
+
+# Constant head of the extraction prompt - MATCHES FRONTEND EXACTLY; the
+# transcript is appended per call
+_EXTRACTION_PROMPT_HEAD: Final[str] = (
+    "You are a medical data extraction assistant. "
+    "Extract structured medical intake information from this conversation. "
+    "Return ONLY valid JSON with EXACTLY these fields:\n"
+    "{\n"
+    '  "chief_complaint": "main health issue",\n'
+    '  "current_medications": [{"name": "med name", "dose": "dosage", "frequency": "how often"}],\n'
+    '  "allergies": [{"allergen": "substance", "reaction": ["symptom1", "symptom2"], "severity": "mild"}],\n'
+    '  "past_medical_history": {"conditions": ["condition1"], "surgeries": ["surgery1"], "hospitalizations": ["hospital1"]},\n'
+    '  "social_history": {"smoking": "status", "alcohol": "status", "occupation": "job"}\n'
+    "}\n"
+    "IMPORTANT:\n"
+    '- Use "current_medications" NOT "medications"\n'
+    '- Use "past_medical_history" NOT "medical_history"\n'
+    '- allergies.reaction must be ARRAY of strings like ["hives", "rash"], NOT single string\n'
+    '- allergies.severity must be one of: "mild", "moderate", "serious", "life-threatening"\n'
+    "- If information not mentioned, use empty arrays [] or empty strings\n\n"
+    "Conversation:\n"
+)
+
+
+@lru_cache(maxsize=1)
+def _build_system_instruction() -> str:
+    """
+    Build the system instruction for Gemini
+
+    This defines the AI's behavior, personality, and conversation structure.
+    Uses configuration variables for branding and tone.
+
+    Cached for the process: it depends only on the (frozen) settings, so
+    every session reuses the same string.
+
+    Returns:
+        str: System instruction text with branding
+    """
+    # Determine greeting tone based on style
+    greeting_tones = {
+        "warm": "Be warm, empathetic, and caring in your tone",
+        "professional": "Maintain a professional and clinical tone throughout",
+        "friendly": "Be friendly, approachable, and conversational"
+    }
+    tone = greeting_tones.get(settings.GREETING_STYLE, greeting_tones["warm"])
+
+    return f"""You are an intelligent front-desk intake coordinator for {settings.CLINIC_NAME} - {settings.SPECIALTY} Department.
+
+Primary Mission:
+- Move the queue quickly by collecting accurate info that busy doctors need.
+- Sound like a professional receptionist: efficient, courteous, but never a clinician.
+- NEVER give medical advice, diagnoses, or treatment suggestions. Redirect such questions back to the doctor's visit.
+
+CONVERSATION STYLE:
+- {tone}
+- Keep questions short and clear; focus on one item at a time.
+- Politely cut off long stories and steer back to the checklist.
+- Confirm key facts (especially allergies) but avoid chit-chat.
+
+REQUIRED INFORMATION (in order):
+1. Chief complaint + goal of visit (why they're here today).
+2. Symptom basics: location, duration, severity (just headline facts for doctor).
+3. Current medications (names, doses, frequency) or clearly note "none".
+4. Allergies (substance + reaction + severity). Double-check accuracy.
+5. Past medical/surgical history or hospitalizations relevant to today.
+6. Social snapshot: smoking, alcohol, occupation, exercise if relevant.
+
+COMPLETION PROTOCOL:
+1. Give a concise receptionist-style summary (max 3 sentences) that doctors can scan fast.
+2. Ask the patient to confirm it is correct and if anything essential is missing.
+3. Once the patient confirms, immediately call complete_intake(). Do not delay or ask new questions afterward.
+4. If the patient asks for medical guidance, respond: "I'm here to capture details for your doctor; they’ll review and advise you shortly."
+
+EXAMPLE SUMMARY:
+"Here’s what I’ll share with your doctor: follow-up visit for [complaint], pain level [severity] for [duration], meds: [list or 'none'], allergies: [list or 'none'], history highlights: [key items]. Does that look right?"
+
+Wait for a "yes" or equivalent, then say "Great, I’ll get this ready for the doctor now." and call complete_intake(). Keep everything brisk and focused on prepping the doctor."""
+
+
+class _ExtractedDataFrame:
+    """An extraction result together with its encoded extracted_data message."""
+
+    __slots__ = ("data", "text")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.text = orjson.dumps({"type": "extracted_data", "data": data}).decode()
+
+
+# ============================================================================
+# AUDIO RING (frontend → Gemini)
+# ============================================================================
+
+class SPSCAudioRing:
+    """
+    Fixed-size ring buffer for exactly one producer and one consumer task
+
+    audio_out_queue only ever has _receive_from_frontend putting and
+    _send_to_gemini taking, so asyncio.Queue's getter/putter bookkeeping is
+    unnecessary. Both sides run on the event loop, so plain head/count
+    integers are safe, and two Events cover waiting on an empty or full ring.
+
+    Must be created inside the running loop (Events bind to it on 3.9).
+    """
+
+    __slots__ = ("_buf", "_size", "_head", "_count", "_not_empty", "_not_full")
+
+    def __init__(self, maxsize: int):
+        self._buf: List[Optional[bytes]] = [None] * maxsize
+        self._size = maxsize
+        self._head = 0   # Index of the oldest item
+        self._count = 0  # Items currently stored
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def empty(self) -> bool:
+        return self._count == 0
+
+    def full(self) -> bool:
+        return self._count == self._size
+
+    async def put(self, item: bytes) -> None:
+        """Append an item, waiting while the ring is full (backpressure)."""
+        while self._count == self._size:
+            await self._not_full.wait()
+        self._buf[(self._head + self._count) % self._size] = item
+        self._count += 1
+        self._not_empty.set()
+        if self._count == self._size:
+            self._not_full.clear()
+
+    def get_nowait(self) -> bytes:
+        """Remove and return the oldest item; raises asyncio.QueueEmpty if empty."""
+        if not self._count:
+            raise asyncio.QueueEmpty
+        head = self._head
+        item = self._buf[head]
+        self._buf[head] = None  # Drop the reference so the frame can be freed
+        self._head = (head + 1) % self._size
+        self._count -= 1
+        self._not_full.set()
+        if not self._count:
+            self._not_empty.clear()
+        return item
+
+    async def get(self) -> bytes:
+        """Remove and return the oldest item, waiting while the ring is empty."""
+        while not self._count:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def peek(self) -> bytes:
+        """Return the oldest item without removing it (ring must not be empty)."""
+        return self._buf[self._head]
+
+    def clear(self) -> None:
+        """Drop every buffered item and wake a waiting producer."""
+        self._buf = [None] * self._size
+        self._head = 0
+        self._count = 0
+        self._not_empty.clear()
+        self._not_full.set()
 
 
 # ============================================================================
@@ -121,9 +498,11 @@ class GeminiLiveSession:
         client (genai.Client): Gemini client instance
         session: Active Gemini Live API session
         websocket: Frontend WebSocket connection
-        audio_in_queue (asyncio.Queue): Queue for audio FROM Gemini
-        audio_out_queue (asyncio.Queue): Queue for audio TO Gemini
-        conversation_history (list): Transcript for data extraction
+        audio_bytes_q (asyncio.Queue): Bounded queue of raw audio bytes FROM Gemini
+        control_q (asyncio.Queue): Bounded queue of tagged tuples FROM Gemini
+            (transcripts, function calls, turn completion)
+        audio_out_queue (SPSCAudioRing): Bounded ring of audio TO Gemini
+        conversation_history (deque): Last 40 transcript entries for data extraction
         latest_structured (dict): Most recent medical data extraction
 
     Usage:
@@ -132,12 +511,22 @@ class GeminiLiveSession:
         await session.cleanup()       # Always call in finally block
     """
 
-    def __init__(self, api_key: str):
+    # LiveConnectConfig per voice name, shared across sessions
+    _config_cache: Dict[str, Any] = {}
+    _config_lock = threading.Lock()
+
+    # Storage directories are created once per process (see _ensure_storage_dirs)
+    _dirs_ready = False
+    _dirs_lock = threading.Lock()
+
+    def __init__(self, api_key: str, client: Optional[Any] = None):
         """
         Initialize a new Gemini Live session
 
         Args:
             api_key (str): Your Google AI API key
+            client (genai.Client, optional): Client to reuse (see
+                get_shared_client); a new one is created for api_key if omitted
 
         Note:
             This only initializes the session object. The actual connection
@@ -145,38 +534,162 @@ class GeminiLiveSession:
         """
         self.api_key = api_key
 
-        # Initialize Gemini client
+        # Deferred google-genai import (no-op after the first session)
+        _ensure_genai()
+        self._ensure_storage_dirs()
+
+        # Initialize Gemini client (or reuse the shared one)
         # v1beta API version required for Live API features
-        self.client = genai.Client(
-            http_options={"api_version": "v1beta"},
-            api_key=api_key
-        )
+        self.client = client if client is not None else _new_client(api_key)
 
         # Queues for bidirectional audio streaming
         # These are initialized in run() when the session starts
-        self.audio_in_queue = None   # From Gemini → to frontend (asyncio.Queue)
-        self.audio_out_queue = None  # From frontend → to Gemini (asyncio.Queue)
+        self.audio_bytes_q = None    # From Gemini → to frontend, raw audio (asyncio.Queue)
+        self.control_q = None        # From Gemini → to frontend, tagged tuples (asyncio.Queue)
+        self.audio_out_queue = None  # From frontend → to Gemini (SPSCAudioRing)
 
         # Session state
         self.session = None          # Gemini Live API session object
         self.websocket = None        # Frontend WebSocket connection
 
         # Conversation tracking for medical data extraction
-        self.conversation_history: List[Dict[str, str]] = []
+        # Bounded to the last 40 entries; maxlen evicts the oldest on append
+        self.conversation_history: deque = deque(maxlen=40)
+        # "Role: text" lines mirroring conversation_history, formatted once
+        # per entry so extraction only has to join them
+        self._transcript_lines: deque = deque(maxlen=40)
+        # Bumped on every history append; len() can't detect change once the
+        # deque is full, so extraction compares versions instead
+        self._history_version = 0
+        self._last_extraction_version = -1
         self.latest_structured: Optional[Dict[str, Any]] = None
+        self._extracted_frame: Optional[_ExtractedDataFrame] = None  # Encoded latest_structured
 
-        # Turn accumulators for streaming text chunks
-        self.current_assistant_turn = ""  # Accumulate AI response chunks
-        self.current_patient_turn = ""    # Accumulate patient speech chunks
+        # Turn accumulators for streaming text chunks; joined once in
+        # _finalize_turn instead of rebuilding a str on every chunk
+        self.current_assistant_turn: List[str] = []  # AI response chunks
+        self.current_patient_turn: List[str] = []    # Patient speech chunks
 
-        # Session logging
+        # Transcription chunks not yet sent to the frontend (UTF-8), flushed
+        # by _flush_transcripts after a short debounce
+        self._pending_patient = bytearray()
+        self._pending_assistant = bytearray()
+        self._flush_deadline = 0.0   # loop.time() after which pending text is flushed
+
+        # Session logging: _log_event encodes records onto _log_queue and
+        # the _drain_logs task writes them in batches to one open handle
         self.session_log_file: Optional[str] = None
+        self._log_raw = None  # Unbuffered file handle (FileIO) for the session log
+        self._log_fh = None   # 64 KiB io.BufferedWriter over _log_raw
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=_LOG_QUEUE_MAX)
+        self._log_writer_task: Optional[asyncio.Task] = None
+        self._log_dropped = 0  # Records dropped because the queue was full
+        self._encode_log = _encode_log_json  # Record → bytes, per log format
         self.session_id: str = uuid.uuid4().hex
 
+        # Per-direction audio counters; summarized per turn instead of
+        # logging every frame (keeps logging off the 50 Hz audio path)
+        self._audio_frames: Counter = Counter()
+        self._audio_bytes: Counter = Counter()
+        self._frontend_queue_stalls = 0  # Puts that waited >5ms on a full frontend-bound queue
+
+        # Extraction runs off the control sender (see _start_extraction)
+        self._extraction_task: Optional[asyncio.Task] = None
+        self._intake_task: Optional[asyncio.Task] = None  # complete_intake() extraction
+        self._background_tasks: set = set()
+        self._save_tasks: set = set()  # Pending conversation saves
+        # Serializes extraction model calls (see _generate_structured_data)
+        self._extraction_lock = asyncio.Lock()
+
     # ========================================================================
     # MAIN SESSION LIFECYCLE
     # ========================================================================
 
+    @classmethod
+    def _ensure_storage_dirs(cls) -> None:
+        """Create the session log / conversation directories once per process."""
+        if cls._dirs_ready:
+            return
+        with cls._dirs_lock:
+            if cls._dirs_ready:
+                return
+            paths = []
+            if settings.ENABLE_SESSION_LOGS:
+                paths.append(settings.SESSION_LOG_PATH)
+            if settings.SAVE_CONVERSATIONS:
+                paths.append(settings.CONVERSATION_STORAGE_PATH)
+            for path in paths:
+                try:
+                    os.makedirs(path, exist_ok=True)
+                except OSError as exc:
+                    # Writes into it will fail and be logged where they happen
+                    logger.warning(f"Unable to create storage directory {path}: {exc}")
+            cls._dirs_ready = True
+
+    @classmethod
+    def _get_live_config(cls, voice: str) -> "types.LiveConnectConfig":
+        """
+        Return the LiveConnectConfig for a voice, building it on first use
+
+        Everything in the config except the voice is identical for every
+        session (system instruction, transcription, complete_intake tool),
+        so one instance per voice is cached at class level instead of
+        rebuilding the nested config objects on every connect.
+        """
+        config = cls._config_cache.get(voice)
+        if config is not None:
+            return config
+
+        with cls._config_lock:
+            config = cls._config_cache.get(voice)
+            if config is not None:
+                return config
+
+            config = types.LiveConnectConfig(
+                # Request audio responses (not text)
+                response_modalities=["AUDIO"],
+
+                # 🔑 CRITICAL: Enable transcription for medical data extraction!
+                # This gives us TEXT transcripts alongside AUDIO
+                output_audio_transcription=types.AudioTranscriptionConfig(),  # Gemini's speech → text
+                input_audio_transcription=types.AudioTranscriptionConfig(),   # Patient's speech → text
+
+                # Voice configuration (from settings)
+                speech_config=types.SpeechConfig(
+                    voice_config=types.VoiceConfig(
+                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                            voice_name=voice
+                            # Configured in .env: Puck, Charon, Kore, Fenrir, or Aoede
+                        )
+                    )
+                ),
+
+                # System instruction - defines AI behavior
+                system_instruction=types.Content(
+                    parts=[types.Part(text=cls._get_system_instruction())]
+                ),
+
+                # ================================================================
+                # FUNCTION CALLING - Intake Completion Signal
+                # ================================================================
+                # AI calls this function when medical intake is complete
+                tools=[
+                    types.Tool(function_declarations=[
+                        types.FunctionDeclaration(
+                            name="complete_intake",
+                            description=(
+                                "Call this function when you have successfully collected ALL required "
+                                "medical information AND provided a verbal summary to the patient "
+                                "for confirmation. Only call after patient confirms the summary is correct."
+                            )
+                        )
+                    ])
+                ]
+            )
+
+            cls._config_cache[voice] = config
+            return config
+
     async def run(self, websocket):
         """
         Main session loop - manages bidirectional audio streaming
@@ -187,7 +700,9 @@ class GeminiLiveSession:
         Task Flow:
         ---------
         1. _receive_from_frontend → audio_out_queue → _send_to_gemini
-        2. _receive_from_gemini → audio_in_queue → _send_to_frontend
+        2. _receive_from_gemini → audio_bytes_q → _send_audio_to_frontend
+                                → control_q     → _send_control_to_frontend
+           (transcription chunks are batched by _flush_transcripts)
         3. _extract_medical_data_periodically → structured data updates
 
         Args:
@@ -202,7 +717,18 @@ class GeminiLiveSession:
             in a finally block after run().
         """
         self.websocket = websocket
+        if settings.EXPECT_UVLOOP:
+            # Module check avoids importing uvloop just to isinstance() it
+            loop_type = type(asyncio.get_running_loop())
+            if not loop_type.__module__.startswith("uvloop"):
+                logger.warning(
+                    "EXPECT_UVLOOP is set but the session runs on %s.%s; "
+                    "start uvicorn with --loop uvloop",
+                    loop_type.__module__, loop_type.__name__,
+                )
         self._init_session_log()
+        if self._log_fh is not None:
+            self._log_writer_task = asyncio.create_task(self._drain_logs())
         self._log_event("session_started", voice=settings.VOICE_MODEL)
 
         # ====================================================================
@@ -210,47 +736,8 @@ class GeminiLiveSession:
         # ====================================================================
         # Configure the Gemini Live API session with our requirements
 
-        config = types.LiveConnectConfig(
-            # Request audio responses (not text)
-            response_modalities=["AUDIO"],
-
-            # 🔑 CRITICAL: Enable transcription for medical data extraction!
-            # This gives us TEXT transcripts alongside AUDIO
-            output_audio_transcription=types.AudioTranscriptionConfig(),  # Gemini's speech → text
-            input_audio_transcription=types.AudioTranscriptionConfig(),   # Patient's speech → text
-
-            # Voice configuration (from settings)
-            speech_config=types.SpeechConfig(
-                voice_config=types.VoiceConfig(
-                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                        voice_name=settings.VOICE_MODEL
-                        # Configured in .env: Puck, Charon, Kore, Fenrir, or Aoede
-                    )
-                )
-            ),
-
-            # System instruction - defines AI behavior
-            system_instruction=types.Content(
-                parts=[types.Part(text=self._get_system_instruction())]
-            ),
-
-            # ================================================================
-            # FUNCTION CALLING - Intake Completion Signal
-            # ================================================================
-            # AI calls this function when medical intake is complete
-            tools=[
-                types.Tool(function_declarations=[
-                    types.FunctionDeclaration(
-                        name="complete_intake",
-                        description=(
-                            "Call this function when you have successfully collected ALL required "
-                            "medical information AND provided a verbal summary to the patient "
-                            "for confirmation. Only call after patient confirms the summary is correct."
-                        )
-                    )
-                ])
-            ]
-        )
+        # Built once per voice and shared by every session (see _get_live_config)
+        config = self._get_live_config(settings.VOICE_MODEL)
 
         logger.info("Connecting to Gemini Live API...")
 
@@ -259,8 +746,6 @@ class GeminiLiveSession:
             # CONNECT TO GEMINI AND RUN TASK GROUP
             # ================================================================
             # Use async context managers for proper resource management
-            # NOTE: Using asyncio.gather() for Python 3.9 compatibility
-            # (TaskGroup was added in Python 3.11)
 
             async with self.client.aio.live.connect(model=MODEL, config=config) as session:
                 # Store session reference
@@ -268,19 +753,20 @@ class GeminiLiveSession:
                 self._log_event("gemini_connected")
 
                 # Initialize queues for audio streaming
-                # audio_in_queue: Unlimited size (audio from Gemini)
-                # audio_out_queue: Max 5 items (backpressure for frontend)
-                self.audio_in_queue = asyncio.Queue()
-                self.audio_out_queue = asyncio.Queue(maxsize=5)
+                # audio_bytes_q / control_q: Bounded (responses from Gemini);
+                #   a slow frontend makes the Gemini receiver wait instead of
+                #   growing memory. Audio travels as bare bytes, everything
+                #   else as (tag, ...) tuples
+                # audio_out_queue: Single producer/consumer ring of raw PCM
+                #   frames; a full ring makes the frontend receiver wait
+                self.audio_bytes_q = asyncio.Queue(maxsize=settings.AUDIO_IN_QUEUE_MAX)
+                self.control_q = asyncio.Queue(maxsize=_CONTROL_QUEUE_MAX)
+                self.audio_out_queue = SPSCAudioRing(_AUDIO_OUT_RING_SIZE)
 
                 logger.info("Connected to Gemini Live API")
 
                 # Send ready status to frontend
-                await websocket.send_json({
-                    "type": "status",
-                    "state": "ready",
-                    "message": "Connected to Gemini"
-                })
+                await self.websocket.send_text(_READY_STATUS_JSON)
                 self._log_event("status", state="ready")
 
                 # ============================================================
@@ -300,22 +786,32 @@ class GeminiLiveSession:
                     # Task 3: Receive responses from Gemini
                     asyncio.create_task(self._receive_from_gemini()),
 
-                    # Task 4: Send responses to frontend WebSocket
-                    asyncio.create_task(self._send_to_frontend()),
+                    # Task 4: Stream Gemini audio to frontend WebSocket
+                    asyncio.create_task(self._send_audio_to_frontend()),
+
+                    # Task 5: Send transcripts and events to frontend WebSocket
+                    asyncio.create_task(self._send_control_to_frontend()),
+
+                    # Task 6: Flush debounced transcription chunks
+                    asyncio.create_task(self._flush_transcripts()),
                 ]
 
-                # Run all tasks concurrently
-                # return_exceptions=True prevents one task's exception from canceling others
-                await asyncio.gather(*tasks, return_exceptions=True)
+                # Run all tasks concurrently; the first one to exit (error,
+                # end_session, or disconnect) tears the others down
+                await _run_fail_fast(tasks)
 
         except asyncio.CancelledError:
             logger.info("Session cancelled")
             self._log_event("session_cancelled")
+        except WebSocketDisconnect as e:
+            # Client went away mid-send; nothing to report back to it
+            logger.info("Frontend disconnected (code=%s)", e.code)
+            self._log_event("frontend_disconnect", code=e.code)
         except Exception as e:
             logger.error(f"Session error: {e}", exc_info=True)
             self._log_event("session_error", error=str(e))
             try:
-                await websocket.send_json({
+                await self._send_json({
                     "type": "error",
                     "message": str(e)
                 })
@@ -323,7 +819,7 @@ class GeminiLiveSession:
                 pass
 
     # ========================================================================
-    # ASYNC TASKS (Run concurrently in TaskGroup)
+    # ASYNC TASKS (Run concurrently, torn down together by _run_fail_fast)
     # ========================================================================
 
     async def _receive_from_frontend(self):
@@ -353,29 +849,35 @@ class GeminiLiveSession:
                 # Receive message from frontend (blocks until message arrives)
                 message = await self.websocket.receive()
 
+                # Client hung up: a normal end of session. Calling receive()
+                # again would raise RuntimeError, so stop here
+                if message.get("type") == "websocket.disconnect":
+                    logger.info("Frontend disconnected (code=%s)", message.get("code"))
+                    self._log_event("frontend_disconnect", code=message.get("code"))
+                    return
+
                 # ============================================================
                 # HANDLE AUDIO DATA
                 # ============================================================
-                if "bytes" in message:
+                audio_chunk = message.get("bytes")
+                if audio_chunk is not None:
                     # Binary message = audio chunk from frontend microphone
-                    audio_chunk = message["bytes"]
-                    logger.debug(f"Received {len(audio_chunk)} bytes from frontend")
+                    self._audio_frames["from_frontend"] += 1
+                    self._audio_bytes["from_frontend"] += len(audio_chunk)
 
-                    # Queue audio for sending to Gemini
-                    # Format: Dict with 'data' and 'mime_type' fields
-                    await self.audio_out_queue.put({
-                        "data": audio_chunk,
-                        "mime_type": "audio/pcm"
-                    })
+                    # Queue raw audio bytes for sending to Gemini
+                    # (_send_to_gemini wraps them with the constant MIME type)
+                    await self.audio_out_queue.put(audio_chunk)
+                    continue
 
                 # ============================================================
                 # HANDLE CONTROL MESSAGES
                 # ============================================================
-                elif "text" in message:
+                text = message.get("text")
+                if text is not None:
                     # Text message = JSON control command
-                    import json
                     try:
-                        data = json.loads(message["text"])
+                        data = orjson.loads(text)
                         msg_type = data.get("type")
 
                         if msg_type == "interrupt":
@@ -401,10 +903,10 @@ class GeminiLiveSession:
                                 await self._interrupt()
                                 await self._signal_turn_end("control_interrupt")
 
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         logger.warning("Invalid JSON from frontend")
 
-        except asyncio.CancelledError:
+        except (asyncio.CancelledError, WebSocketDisconnect):
             logger.info("Frontend receiver stopped")
             raise
         except Exception as e:
@@ -420,26 +922,45 @@ class GeminiLiveSession:
 
         Pattern:
         -------
-        1. Get audio from queue (blocks if queue is empty)
-        2. Send to Gemini via session.send()
-        3. Repeat
+        1. Wait for the next frame on the ring
+        2. Merge up to settings.GEMINI_SEND_COALESCE frames that piled up
+           while the previous send was in flight into one message
+        3. Send it via session.send() and repeat
 
         Note:
             Audio is sent as continuous stream (not turn-based)
             end_of_turn is NOT set here - Gemini detects pauses automatically
+            Chunks are forwarded by reference with no intermediate copies.
+            They stay as `bytes`: types.Blob rejects memoryview/bytearray
+            slices, and queued frames would outlive a reused buffer.
         """
         logger.info("Started sending to Gemini")
+        # Frames merged per send (settings.GEMINI_SEND_COALESCE, 1 = off)
+        max_frames = max(1, settings.GEMINI_SEND_COALESCE)
+        ring = self.audio_out_queue
         try:
             while True:
-                # Get next audio chunk from queue
-                # This blocks if queue is empty (waiting for frontend audio)
-                audio_data = await self.audio_out_queue.get()
+                # Wait for frontend audio
+                audio_chunk = await ring.get()
+
+                # Coalesce backlog: one websocket frame instead of N
+                if max_frames > 1 and not ring.empty():
+                    batch = [audio_chunk]
+                    batch_size = len(audio_chunk)
+                    while (not ring.empty() and len(batch) < max_frames and
+                           batch_size + len(ring.peek()) <= _SEND_BATCH_MAX_BYTES):
+                        chunk = ring.get_nowait()
+                        batch.append(chunk)
+                        batch_size += len(chunk)
+                    if len(batch) > 1:
+                        audio_chunk = b"".join(batch)
 
                 # Send to Gemini Live API
                 # session.send() is from official Google SDK
-                await self.session.send(input=audio_data)
+                await self.session.send(input={"data": audio_chunk, "mime_type": _AUDIO_MIME})
 
-                logger.debug(f"Sent {len(audio_data['data'])} bytes to Gemini")
+                self._audio_frames["to_gemini"] += 1
+                self._audio_bytes["to_gemini"] += len(audio_chunk)
 
         except asyncio.CancelledError:
             logger.info("Gemini sender stopped")
@@ -479,92 +1000,55 @@ class GeminiLiveSession:
 
                 # Iterate through all responses in this turn
                 async for response in turn:
-
-                    # ========================================================
-                    # HANDLE PATIENT INPUT TRANSCRIPTION
-                    # ========================================================
-                    # This is the patient's speech transcribed to text
-                    # NOTE: input_transcription is an OBJECT with .text field (not a list!)
-                    # It streams in small chunks just like output_transcription
-                    if hasattr(response, 'server_content') and response.server_content:
-                        if hasattr(response.server_content, 'input_transcription'):
-                            input_trans = response.server_content.input_transcription
-                            if input_trans:  # Check it's not None
-                                user_text = getattr(input_trans, 'text', '')
-                                if user_text:
-                                    logger.debug(f"Patient transcription chunk: {user_text}")
-                                    # Accumulate for this turn (don't save yet)
-                                    self.current_patient_turn += user_text
-                                    # Send to frontend
-                                    await self.audio_in_queue.put({
-                                        "type": "text",
-                                        "role": "patient",
-                                        "text": user_text
-                                    })
+                    # Bind every field once per response; data and text are
+                    # computed properties that walk model_turn.parts on
+                    # each access, so the arms below only touch locals.
+                    # LiveServerMessage is a pydantic model (no protobuf
+                    # HasField): every field always exists and is None when
+                    # unset, so plain attribute reads replace hasattr/getattr
+                    data = response.data
+                    text = response.text
+                    tc = response.tool_call
+                    sc = response.server_content
 
                     # ========================================================
                     # HANDLE AUDIO DATA
                     # ========================================================
-                    if data := response.data:
+                    if data:
                         # Audio bytes from Gemini's speech
-                        logger.debug(f"Received {len(data)} bytes from Gemini")
+                        self._audio_frames["from_gemini"] += 1
+                        self._audio_bytes["from_gemini"] += len(data)
 
-                        # Queue for frontend playback
-                        await self.audio_in_queue.put({
-                            "type": "audio",
-                            "data": data
-                        })
+                        # Queue raw bytes for frontend playback (no wrapper dict)
+                        await self._queue_for_frontend(self.audio_bytes_q, data)
 
                     # ========================================================
                     # HANDLE GEMINI TEXT TRANSCRIPT
                     # ========================================================
-                    if text := response.text:
+                    if text:
                         # Text transcript of what Gemini is saying
-                        logger.info(f"Gemini: {text[:100]}...")
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(f"Gemini: {text[:100]}...")
 
                         # Accumulate for this turn (don't save yet)
-                        self.current_assistant_turn += text
+                        self.current_assistant_turn.append(text)
 
                         # Queue for frontend display
-                        await self.audio_in_queue.put({
-                            "type": "text",
-                            "role": "assistant",
-                            "text": text
-                        })
-
-                    # ========================================================
-                    # HANDLE GEMINI OUTPUT TRANSCRIPTION (Alternative)
-                    # ========================================================
-                    # Some models return transcription in output_transcription
-                    # NOTE: output_transcription is an OBJECT with .text field (not a list!)
-                    # It streams in small chunks like "I a", "m s", "orr", "y t"...
-                    if hasattr(response, 'server_content') and response.server_content:
-                        if hasattr(response.server_content, 'output_transcription'):
-                            output_trans = response.server_content.output_transcription
-                            if output_trans:  # Check it's not None
-                                ai_text = getattr(output_trans, 'text', '')
-                                if ai_text:
-                                    logger.debug(f"Gemini transcription chunk: {ai_text}")
-                                    # Accumulate for this turn (don't save yet)
-                                    self.current_assistant_turn += ai_text
-                                    # Send to frontend
-                                    await self.audio_in_queue.put({
-                                        "type": "text",
-                                        "role": "assistant",
-                                        "text": ai_text
-                                    })
+                        await self._queue_for_frontend(
+                            self.control_q, (_T_TEXT, "assistant", text)
+                        )
 
                     # ========================================================
                     # HANDLE FUNCTION CALLS - CORRECT IMPLEMENTATION
                     # ========================================================
                     # Function calls are at response.tool_call (top-level field)
                     # NOT inside server_content.model_turn.parts!
-                    if response.tool_call:
-                        logger.info(f"🔍 TOOL CALL DETECTED - type: {type(response.tool_call)}")
-                        logger.info(f"Tool call content: {response.tool_call}")
+                    if tc:
+                        logger.info(f"🔍 TOOL CALL DETECTED - type: {type(tc)}")
+                        logger.info(f"Tool call content: {tc}")
 
-                        if response.tool_call.function_calls:
-                            for func_call in response.tool_call.function_calls:
+                        if tc.function_calls:
+                            for func_call in tc.function_calls:
                                 logger.info(f"🎯 FUNCTION CALL: {func_call.name}")
                                 logger.info(f"Function ID: {func_call.id}")
                                 logger.info(f"Function args: {func_call.args if hasattr(func_call, 'args') else 'none'}")
@@ -573,26 +1057,62 @@ class GeminiLiveSession:
                                     logger.info("✅ complete_intake() called - triggering final extraction")
                                     self._log_event("function_call", name="complete_intake")
                                     # Trigger final data extraction
-                                    await self.audio_in_queue.put({
-                                        "type": "function_call",
-                                        "function_name": "complete_intake"
-                                    })
-
-                    # ========================================================
-                    # HANDLE TURN COMPLETE
-                    # ========================================================
-                    # Check if turn is complete (if attribute exists)
-                    if hasattr(response, 'server_content') and response.server_content:
-                        if hasattr(response.server_content, 'turn_complete') and response.server_content.turn_complete:
+                                    await self._queue_for_frontend(
+                                        self.control_q, (_T_FN, "complete_intake")
+                                    )
+
+                    if sc is not None:
+                        # ====================================================
+                        # HANDLE PATIENT INPUT TRANSCRIPTION
+                        # ====================================================
+                        # This is the patient's speech transcribed to text
+                        # NOTE: input_transcription is an OBJECT with .text field (not a list!)
+                        # It streams in small chunks just like output_transcription
+                        input_trans = sc.input_transcription
+                        if input_trans is not None:
+                            user_text = input_trans.text
+                            if user_text:
+                                logger.debug("Patient transcription chunk: %s", user_text)
+                                # Accumulate for this turn (don't save yet)
+                                self.current_patient_turn.append(user_text)
+                                # Buffer for the frontend (sent by the debounced flush)
+                                self._pending_patient += user_text.encode()
+                                await self._transcript_chunk_buffered(user_text)
+
+                        # ====================================================
+                        # HANDLE GEMINI OUTPUT TRANSCRIPTION (Alternative)
+                        # ====================================================
+                        # Some models return transcription in output_transcription
+                        # NOTE: output_transcription is an OBJECT with .text field (not a list!)
+                        # It streams in small chunks like "I a", "m s", "orr", "y t"...
+                        output_trans = sc.output_transcription
+                        if output_trans is not None:
+                            ai_text = output_trans.text
+                            if ai_text:
+                                logger.debug("Gemini transcription chunk: %s", ai_text)
+                                # Accumulate for this turn (don't save yet)
+                                self.current_assistant_turn.append(ai_text)
+                                # Buffer for the frontend (sent by the debounced flush)
+                                self._pending_assistant += ai_text.encode()
+                                await self._transcript_chunk_buffered(ai_text)
+
+                        # ====================================================
+                        # HANDLE TURN COMPLETE
+                        # ====================================================
+                        # Handled last so this response's audio/transcripts are
+                        # queued before the turn is finalized
+                        if sc.turn_complete:
                             # AI finished speaking - finalize accumulated turns
                             logger.debug("Turn complete")
+                            self._log_audio_stats()
+
+                            # Send any buffered transcript text before turn_complete
+                            await self._flush_pending_transcripts()
 
                             # Save accumulated turns to conversation history
                             self._finalize_turn()
 
-                            await self.audio_in_queue.put({
-                                "type": "turn_complete"
-                            })
+                            await self._queue_for_frontend(self.control_q, (_T_TURN,))
 
         except asyncio.CancelledError:
             logger.info("Gemini receiver stopped")
@@ -601,120 +1121,202 @@ class GeminiLiveSession:
             logger.error(f"Error receiving from Gemini: {e}", exc_info=True)
             raise
 
-    async def _send_to_frontend(self):
+    async def _flush_transcripts(self):
         """
-        Task 4: Send responses from queue to frontend WebSocket
-
-        This task pulls responses from audio_in_queue and sends them
-        to the frontend WebSocket.
+        Task 6: Send buffered transcription chunks once they go quiet
 
-        Message Types Sent:
-        ------------------
-        - Binary: Audio bytes for playback
-        - JSON: Transcripts, status updates, medical data
+        Transcription streams in tiny fragments ("I a", "m s", "orr"...).
+        Instead of one queue hop and WebSocket frame per fragment, chunks are
+        buffered per role and sent as a single transcript message when no new
+        chunk arrived for _TRANSCRIPT_DEBOUNCE_SECONDS. Sentence ends and
+        turn_complete flush immediately (see _transcript_chunk_buffered).
         """
-        logger.info("Started sending to frontend")
+        loop = asyncio.get_running_loop()
         try:
             while True:
-                # Get next response from queue
-                # This blocks if queue is empty (waiting for Gemini response)
-                response = await self.audio_in_queue.get()
-
-                # ============================================================
-                # SEND AUDIO TO FRONTEND
-                # ============================================================
-                if response["type"] == "audio":
-                    # Send audio bytes as binary WebSocket frame
-                    await self.websocket.send_bytes(response["data"])
-                    logger.debug(f"Sent {len(response['data'])} bytes to frontend")
+                await asyncio.sleep(_TRANSCRIPT_DEBOUNCE_SECONDS)
+                if loop.time() >= self._flush_deadline:
+                    await self._flush_pending_transcripts()
+        except asyncio.CancelledError:
+            logger.info("Transcript flusher stopped")
+            raise
 
-                # ============================================================
-                # SEND TRANSCRIPT TO FRONTEND
-                # ============================================================
-                elif response["type"] == "text":
-                    # Send transcript as JSON
-                    await self.websocket.send_json({
-                        "type": "transcript",
-                        "role": response["role"],
-                        "text": response["text"]
-                    })
+    async def _send_audio_to_frontend(self):
+        """
+        Task 4: Stream audio from audio_bytes_q to frontend WebSocket
 
-                # ============================================================
-                # HANDLE FUNCTION CALL - Intake Complete
-                # ============================================================
-                elif response["type"] == "function_call" and response["function_name"] == "complete_intake":
-                    logger.info("📊 [FUNCTION_CALL] Processing complete_intake() - final data extraction")
-                    self._log_event("function_call_processing", name="complete_intake")
+        Tight loop with no type dispatch: every queue item is raw PCM bytes
+        and goes out as a binary WebSocket frame for playback. With
+        settings.COALESCE_AUDIO, chunks already waiting in the queue are
+        packed into one length-prefixed frame (see _AUDIO_MULTI_TAG) that
+        the frontend splits back into chunks.
+        """
+        logger.info("Started sending audio to frontend")
+        try:
+            queue = self.audio_bytes_q
+            coalesce = settings.COALESCE_AUDIO
+            while True:
+                # Blocks if queue is empty (waiting for Gemini audio)
+                data = await queue.get()
+
+                # Optionally merge chunks that are already waiting into one
+                # multi-chunk frame (never waits for more audio to arrive)
+                if coalesce and not queue.empty():
+                    parts = [_AUDIO_MULTI_TAG, _pack_chunk_len(len(data)), data]
+                    chunks = 1
+                    while chunks < _AUDIO_COALESCE_MAX_CHUNKS and not queue.empty():
+                        chunk = queue.get_nowait()
+                        parts.append(_pack_chunk_len(len(chunk)))
+                        parts.append(chunk)
+                        chunks += 1
+                    data = b"".join(parts)
+
+                await self.websocket.send_bytes(data)
+                self._audio_frames["to_frontend"] += 1
+                self._audio_bytes["to_frontend"] += len(data)
 
-                    # Generate final structured data from complete conversation
-                    structured = await self._generate_structured_data()
+        except asyncio.CancelledError:
+            logger.info("Frontend audio sender stopped")
+            raise
+        except Exception as e:
+            logger.error(f"Error sending audio to frontend: {e}", exc_info=True)
+            raise
 
-                    logger.info(f"🔎 [FUNCTION_CALL] Extraction returned: {type(structured)} - {bool(structured)}")
-                    if structured:
-                        logger.info(f"📦 [FUNCTION_CALL] Structured data keys: {list(structured.keys())}")
-                    else:
-                        logger.error(f"❌ [FUNCTION_CALL] Extraction returned empty/None! Cannot send data to frontend.")
+    async def _send_control_to_frontend(self):
+        """
+        Task 5: Send control messages from control_q to frontend WebSocket
 
-                    if structured:
-                        # Send extracted medical data to frontend
-                        await self.websocket.send_json({
-                            "type": "extracted_data",
-                            "data": structured
-                        })
-                        logger.info("✅ [FUNCTION_CALL] Extracted data sent to frontend")
-                    else:
-                        logger.warning("⚠️ [FUNCTION_CALL] Skipping extracted_data message - no data to send")
-
-                    # Save conversation to file if enabled
-                    if settings.SAVE_CONVERSATIONS:
-                        logger.info(f"💾 [FUNCTION_CALL] Saving conversation to file...")
-                        await self._save_conversation_to_file(structured)
-
-                    # Send intake_complete signal to trigger auto-navigation
-                    await self.websocket.send_json({
-                        "type": "intake_complete",
-                        "message": "Medical intake completed successfully"
-                    })
-                    logger.info("🏁 [FUNCTION_CALL] Intake complete signal sent - frontend will auto-navigate")
+        Queue items are tuples whose first element is an integer tag
+        (_T_TEXT, _T_FN, _T_TURN); the remaining elements are the payload.
 
-                # ============================================================
-                # HANDLE TURN COMPLETE
-                # ============================================================
-                elif response["type"] == "turn_complete":
-                    # AI finished speaking - send turn_complete to frontend
-                    await self.websocket.send_json({
-                        "type": "turn_complete"
-                    })
-                    self._log_event("turn_complete")
-
-                    # FALLBACK: If conversation has enough data, trigger extraction
-                    # (In case function calling doesn't work as expected)
-                    if len(self.conversation_history) >= 10 and not self.latest_structured:
-                        logger.info("⚡ FALLBACK: Conversation has sufficient data, triggering extraction")
-                        structured = await self._generate_structured_data()
-
-                        if structured and structured.get('chief_complaint'):
-                            # Send extracted data
-                            await self.websocket.send_json({
-                                "type": "extracted_data",
-                                "data": structured
-                            })
-                            logger.info("✅ Fallback extraction successful")
-
-                            # Save conversation if enabled
-                            if settings.SAVE_CONVERSATIONS:
-                                await self._save_conversation_to_file(structured)
-
-                            # Don't auto-navigate yet - let user manually proceed
-                            # (We can add auto-navigation later once function calling works)
+        Message Types Sent:
+        ------------------
+        - JSON: Transcripts, status updates, medical data
+        """
+        logger.info("Started sending control messages to frontend")
+        # Handlers indexed by tag (slot 0 unused): a tuple index, no hashing
+        handlers = (
+            None,
+            self._handle_text_out,           # _T_TEXT
+            self._handle_fn_out,             # _T_FN
+            self._handle_turn_complete_out,  # _T_TURN
+        )
+        try:
+            while True:
+                # Get next message from queue
+                # This blocks if queue is empty (waiting for Gemini response)
+                message = await self.control_q.get()
+                await handlers[message[0]](message)
 
         except asyncio.CancelledError:
-            logger.info("Frontend sender stopped")
+            logger.info("Frontend control sender stopped")
             raise
         except Exception as e:
-            logger.error(f"Error sending to frontend: {e}", exc_info=True)
+            logger.error(f"Error sending control message to frontend: {e}", exc_info=True)
             raise
 
+    # ------------------------------------------------------------------
+    # control_q handlers (dispatched by tag in _send_control_to_frontend)
+    # ------------------------------------------------------------------
+
+    async def _handle_text_out(self, message: tuple) -> None:
+        """(_T_TEXT, role, text): send a transcript to the frontend."""
+        await self._send_json({
+            "type": "transcript",
+            "role": message[1],
+            "text": message[2]
+        })
+
+    async def _handle_fn_out(self, message: tuple) -> None:
+        """(_T_FN, name): Gemini called a function - only complete_intake is known."""
+        if message[1] == "complete_intake":
+            # Extraction is a separate model call that can take
+            # seconds; run it beside the sender so transcripts and
+            # turn events keep flowing meanwhile
+            self._intake_task = self._start_extraction(self._complete_intake())
+
+    async def _handle_turn_complete_out(self, message: tuple) -> None:
+        """(_T_TURN,): AI finished speaking - send turn_complete to frontend."""
+        await self.websocket.send_text(_TURN_COMPLETE_JSON)
+        self._log_event("turn_complete")
+
+        # FALLBACK: If conversation has enough data, trigger extraction
+        # (In case function calling doesn't work as expected)
+        if (
+            len(self.conversation_history) >= 10
+            and not self.latest_structured
+            and self._extraction_task is None
+        ):
+            self._start_extraction(self._fallback_extraction())
+
+    def _start_extraction(self, coro) -> "asyncio.Task":
+        """Run an extraction coroutine as a background task tracked on the session."""
+        task = asyncio.create_task(coro)
+        self._extraction_task = task
+        self._background_tasks.add(task)
+        task.add_done_callback(self._extraction_done)
+        return task
+
+    def _extraction_done(self, task: "asyncio.Task") -> None:
+        self._background_tasks.discard(task)
+        if self._extraction_task is task:
+            self._extraction_task = None
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            logger.error(f"Background extraction failed: {exc}", exc_info=exc)
+
+    def _start_save(self, structured: Optional[Dict[str, Any]]) -> None:
+        """Save the conversation in a background task; cleanup() waits for all of them."""
+        task = asyncio.create_task(self._save_conversation_to_file(structured))
+        self._save_tasks.add(task)
+        task.add_done_callback(self._save_tasks.discard)
+
+    async def _complete_intake(self):
+        """Final extraction after complete_intake(): send data, save, signal completion."""
+        logger.info("📊 [FUNCTION_CALL] Processing complete_intake() - final data extraction")
+        self._log_event("function_call_processing", name="complete_intake")
+
+        # Generate final structured data from complete conversation
+        structured = None
+        try:
+            structured = await self._generate_structured_data()
+        finally:
+            # Save conversation to file if enabled (in the background - the
+            # frontend hears intake_complete without waiting on the disk).
+            # Started even if cleanup() cancelled the extraction: the file
+            # is the audit record, so fall back to the last extraction
+            if settings.SAVE_CONVERSATIONS:
+                logger.info(f"💾 [FUNCTION_CALL] Saving conversation to file...")
+                self._start_save(structured if structured is not None else self.latest_structured)
+
+        if structured:
+            # Send extracted medical data to frontend
+            await self._send_extracted_data(structured)
+            # keys() view is only stringified if the record is emitted
+            logger.info("✅ [FUNCTION_CALL] Extracted data sent to frontend (keys=%s)", structured.keys())
+        else:
+            logger.error("❌ [FUNCTION_CALL] Extraction returned %r - no extracted_data sent", structured)
+
+        # Send intake_complete signal to trigger auto-navigation
+        await self.websocket.send_text(_INTAKE_COMPLETE_JSON)
+        logger.info("🏁 [FUNCTION_CALL] Intake complete signal sent - frontend will auto-navigate")
+
+    async def _fallback_extraction(self):
+        """Extraction for sessions where complete_intake() never arrives."""
+        structured = await self._generate_structured_data(wait=False)
+
+        if structured and structured.get('chief_complaint'):
+            # Send extracted data
+            await self._send_extracted_data(structured)
+            logger.info("✅ FALLBACK: extraction from %d entries sent", len(self.conversation_history))
+
+            # Save conversation if enabled
+            if settings.SAVE_CONVERSATIONS:
+                self._start_save(structured)
+
+            # Don't auto-navigate yet - let user manually proceed
+            # (We can add auto-navigation later once function calling works)
+
     async def _extract_medical_data_periodically(self):
         """
         Task 5: Periodically extract structured medical data
@@ -722,6 +1324,10 @@ class GeminiLiveSession:
         This task runs in the background and extracts structured medical
         data from the conversation every 10 seconds.
 
+        NOTE: Not scheduled by run() - extraction is driven by the
+        complete_intake() function call (plus the turn-complete fallback).
+        Kept for sessions that want live form updates.
+
         Why Periodic?
         ------------
         - Provides real-time form updates to frontend
@@ -738,14 +1344,11 @@ class GeminiLiveSession:
 
                 # Only extract if we have enough conversation
                 if len(self.conversation_history) >= 4:
-                    structured = await self._generate_structured_data()
+                    structured = await self._generate_structured_data(wait=False)
 
                     if structured:
                         # Send to frontend
-                        await self.websocket.send_json({
-                            "type": "extracted_data",
-                            "data": structured
-                        })
+                        await self._send_extracted_data(structured)
                         logger.info("Sent periodic medical data update")
 
         except asyncio.CancelledError:
@@ -761,35 +1364,163 @@ class GeminiLiveSession:
     def _init_session_log(self) -> None:
         if not settings.ENABLE_SESSION_LOGS:
             return
+        binary = settings.SESSION_LOG_BINARY
+        if binary and msgpack is None:
+            logger.warning("SESSION_LOG_BINARY is set but msgpack is not installed; writing JSON logs")
+            binary = False
+        self._encode_log = _encode_log_msgpack if binary else _encode_log_json
         try:
-            os.makedirs(settings.SESSION_LOG_PATH, exist_ok=True)
-            timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-            filename = f"session_{timestamp}_{self.session_id}.log"
+            timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+            extension = "mpk" if binary else "log"
+            filename = f"session_{timestamp}_{self.session_id}.{extension}"
             self.session_log_file = os.path.join(settings.SESSION_LOG_PATH, filename)
             metadata = {
                 "session_id": self.session_id,
-                "started_at": datetime.utcnow().isoformat() + "Z",
+                "started_at": _utc_timestamp(),
                 "voice": settings.VOICE_MODEL,
             }
-            with open(self.session_log_file, 'w', encoding='utf-8') as f:
-                f.write(json.dumps(metadata) + "\n")
+            # Opened once for the whole session; _drain_logs appends to it.
+            # Records collect in the 64 KiB buffer and reach the file only
+            # on the writer's interval flush (or when the buffer fills)
+            self._log_raw = open(self.session_log_file, 'ab', buffering=0)
+            self._log_fh = io.BufferedWriter(self._log_raw, buffer_size=_LOG_BUFFER_BYTES)
+            self._log_fh.write(self._encode_log(metadata))
         except Exception as exc:  # pragma: no cover
             logger.warning(f"Unable to initialize session log: {exc}")
+            if self._log_raw is not None:
+                self._log_raw.close()
             self.session_log_file = None
+            self._log_raw = None
+            self._log_fh = None
 
     def _log_event(self, event: str, **data) -> None:
-        if not self.session_log_file:
+        """Encode a session log record and hand it to the background writer."""
+        if self._log_fh is None:
             return
         entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "event": event,
             "data": data,
         }
         try:
-            with open(self.session_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._log_queue.put_nowait(self._encode_log(entry))
+        except asyncio.QueueFull:
+            self._log_dropped += 1
+
+    async def _drain_logs(self) -> None:
+        """
+        Background writer for the session log
+
+        Waits for a record, gives others _LOG_FLUSH_SECONDS to pile up, then
+        writes everything pending with one write() + flush(). Sleeping
+        instead of wait_for(queue.get()) keeps a timeout from ever losing a
+        record.
+        """
+        queue = self._log_queue
+        while True:
+            batch = [await queue.get()]
+            try:
+                if queue.qsize() < _LOG_BATCH_MAX:
+                    await asyncio.sleep(_LOG_FLUSH_SECONDS)
+            finally:
+                # Also on cancellation, so the record already taken is kept
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                self._write_log_batch(batch)
+
+    def _write_log_batch(self, batch: List[bytes]) -> None:
+        try:
+            self._log_fh.write(b"".join(batch))
+            self._log_fh.flush()
         except Exception as exc:  # pragma: no cover
-            logger.warning(f"Unable to write session log entry: {exc}")
+            logger.warning(f"Unable to write session log entries: {exc}")
+
+    async def _close_session_log(self) -> None:
+        """Stop the writer, write whatever is still queued, and close the file."""
+        if self._log_writer_task is not None:
+            self._log_writer_task.cancel()
+            await asyncio.gather(self._log_writer_task, return_exceptions=True)
+            self._log_writer_task = None
+        if self._log_fh is None:
+            return
+        batch = []
+        while not self._log_queue.empty():
+            batch.append(self._log_queue.get_nowait())
+        if batch:
+            self._write_log_batch(batch)
+        if self._log_dropped:
+            logger.warning(f"Session log dropped {self._log_dropped} records (writer queue full)")
+        self._log_fh.close()  # Flushes the buffer
+        if not self._log_raw.closed:
+            self._log_raw.close()
+        self._log_fh = None
+        self._log_raw = None
+
+    async def _send_extracted_data(self, structured: Dict[str, Any]) -> None:
+        """
+        Send an extracted_data message, reusing the encoded frame when possible
+
+        Extraction results are replaced wholesale (never mutated), and an
+        unchanged conversation returns the same dict, so the encoded frame is
+        cached against the identity of the dict it was built from.
+        """
+        frame = self._extracted_frame
+        if frame is None or frame.data is not structured:
+            frame = _ExtractedDataFrame(structured)
+            self._extracted_frame = frame
+        await self.websocket.send_text(frame.text)
+
+    async def _send_json(self, payload: Dict[str, Any]) -> None:
+        """Send a JSON control message to the frontend as a text frame (orjson-encoded)"""
+        await self.websocket.send_text(orjson.dumps(payload).decode())
+
+    async def _queue_for_frontend(self, queue: asyncio.Queue, item: Any) -> None:
+        """
+        Queue a response for the frontend senders, waiting while the queue is full
+
+        Waiting here is the backpressure path: it stops reading from Gemini
+        until the frontend catches up. Puts that wait longer than
+        _QUEUE_STALL_SECONDS are counted so slow clients show up in the logs.
+        """
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await queue.put(item)
+        if loop.time() - started > _QUEUE_STALL_SECONDS:
+            self._frontend_queue_stalls += 1
+
+    async def _transcript_chunk_buffered(self, text: str) -> None:
+        """Push the debounce deadline out, or flush now if the chunk ends a sentence."""
+        if text.rstrip().endswith(_SENTENCE_END):
+            await self._flush_pending_transcripts()
+        else:
+            self._flush_deadline = asyncio.get_running_loop().time() + _TRANSCRIPT_DEBOUNCE_SECONDS
+
+    async def _flush_pending_transcripts(self) -> None:
+        """Queue buffered transcript text for the frontend (patient first) and reset the buffers."""
+        for role, pending in (("patient", self._pending_patient), ("assistant", self._pending_assistant)):
+            if pending:
+                # Decode and clear before awaiting so chunks arriving while
+                # the queue is full land in the next flush
+                text = pending.decode()
+                pending.clear()
+                await self._queue_for_frontend(self.control_q, (_T_TEXT, role, text))
+
+    def _log_audio_stats(self) -> None:
+        """Emit one debug line with the cumulative per-direction audio counters."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "Audio stats: %s, frontend_queue_stalls=%d",
+            ", ".join(
+                f"{direction}={self._audio_frames[direction]} frames/{self._audio_bytes[direction]} bytes"
+                for direction in ("from_frontend", "to_gemini", "from_gemini", "to_frontend")
+            ),
+            self._frontend_queue_stalls,
+        )
 
     async def _interrupt(self):
         """
@@ -805,11 +1536,8 @@ class GeminiLiveSession:
         """
         if self.session:
             # Clear all queued audio to stop playback immediately
-            while not self.audio_in_queue.empty():
-                try:
-                    self.audio_in_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            # (transcripts on control_q are kept)
+            _drain_queue(self.audio_bytes_q)
 
             logger.info("Interrupted AI response")
             self._log_event("interrupt_triggered")
@@ -832,30 +1560,34 @@ class GeminiLiveSession:
         Combines all streaming chunks from current turn into single entries.
         """
         # Save assistant's complete turn
-        if self.current_assistant_turn.strip():
-            logger.info(f"📝 [TURN_FINALIZE] Saving assistant turn: '{self.current_assistant_turn[:100]}{'...' if len(self.current_assistant_turn) > 100 else ''}'")
+        assistant_turn = "".join(self.current_assistant_turn).strip()
+        if assistant_turn:
+            preview = assistant_turn if len(assistant_turn) <= 100 else assistant_turn[:100] + "..."
+            logger.info("📝 [TURN_FINALIZE] Saving assistant turn: '%s'", preview)
             self.conversation_history.append({
                 "role": "assistant",
-                "text": self.current_assistant_turn.strip()
+                "text": assistant_turn
             })
-            self._log_event("transcript", role="assistant", text=self.current_assistant_turn.strip())
-            self.current_assistant_turn = ""  # Reset accumulator
+            self._transcript_lines.append(_ROLE_PREFIX["assistant"] + assistant_turn)
+            self._history_version += 1
+            self._log_event("transcript", role="assistant", text=assistant_turn)
+            self.current_assistant_turn.clear()  # Reset accumulator
 
         # Save patient's complete turn
-        if self.current_patient_turn.strip():
-            logger.info(f"📝 [TURN_FINALIZE] Saving patient turn: '{self.current_patient_turn[:100]}{'...' if len(self.current_patient_turn) > 100 else ''}'")
+        patient_turn = "".join(self.current_patient_turn).strip()
+        if patient_turn:
+            preview = patient_turn if len(patient_turn) <= 100 else patient_turn[:100] + "..."
+            logger.info("📝 [TURN_FINALIZE] Saving patient turn: '%s'", preview)
             self.conversation_history.append({
                 "role": "patient",
-                "text": self.current_patient_turn.strip()
+                "text": patient_turn
             })
-            self._log_event("transcript", role="patient", text=self.current_patient_turn.strip())
-            self.current_patient_turn = ""  # Reset accumulator
-
-        # Keep last 40 turns only
-        if len(self.conversation_history) > 40:
-            self.conversation_history = self.conversation_history[-40:]
+            self._transcript_lines.append(_ROLE_PREFIX["patient"] + patient_turn)
+            self._history_version += 1
+            self._log_event("transcript", role="patient", text=patient_turn)
+            self.current_patient_turn.clear()  # Reset accumulator
 
-        logger.info(f"📚 [TURN_FINALIZE] Total conversation turns: {len(self.conversation_history)}")
+        logger.info("📚 [TURN_FINALIZE] Total conversation turns: %d", len(self.conversation_history))
 
     def _append_history(self, role: str, text: str):
         """
@@ -866,29 +1598,34 @@ class GeminiLiveSession:
             text (str): What was said
 
         Note:
-            Keeps only last 40 turns to prevent memory issues
+            Keeps only last 40 turns to prevent memory issues (deque maxlen)
         """
         text = text.strip()
         if not text:
             return
 
-        logger.info(f"📝 [CONVERSATION] Appending to history - role={role}, text_len={len(text)}, text='{text[:50]}{'...' if len(text) > 50 else ''}'")
+        logger.info("📝 [CONVERSATION] Appending to history - role=%s, text_len=%d, text='%.50s%s'",
+                    role, len(text), text, "..." if len(text) > 50 else "")
 
         self.conversation_history.append({
             "role": role,
             "text": text
         })
+        prefix = _ROLE_PREFIX.get(role) or f"{role.capitalize()}: "
+        self._transcript_lines.append(prefix + text)
+        self._history_version += 1
 
-        logger.info(f"📚 [CONVERSATION] Total conversation entries: {len(self.conversation_history)}")
+        logger.info("📚 [CONVERSATION] Total conversation entries: %d", len(self.conversation_history))
 
-        # Keep last 40 turns only
-        if len(self.conversation_history) > 40:
-            self.conversation_history = self.conversation_history[-40:]
-
-    async def _generate_structured_data(self) -> Optional[Dict[str, Any]]:
+    async def _generate_structured_data(self, wait: bool = True) -> Optional[Dict[str, Any]]:
         """
         Extract structured medical data from conversation history
 
+        At most one extraction runs per session at a time. Callers that
+        must have fresh data (complete_intake) wait for one in flight to
+        finish; opportunistic callers pass wait=False and get the cached
+        result instead of queuing a second model call.
+
         This uses a secondary Gemini model call to analyze the conversation
         and extract structured medical intake information.
 
@@ -899,6 +1636,10 @@ class GeminiLiveSession:
         3. Parse response as MedicalIntake object
         4. Return as dictionary
 
+        Args:
+            wait: If False and an extraction is already running, return the
+                cached data immediately
+
         Returns:
             Optional[Dict]: Structured medical data, or None if extraction fails
 
@@ -906,45 +1647,39 @@ class GeminiLiveSession:
             This is a separate API call (not part of Live API session)
             Falls back to latest cached data if extraction fails
         """
-        logger.info(f"🔍 [EXTRACTION] Starting data extraction from {len(self.conversation_history)} conversation entries")
+        if not wait and self._extraction_lock.locked():
+            logger.info("⏭️ [EXTRACTION] Extraction already in flight - skipping")
+            return self.latest_structured
+        async with self._extraction_lock:
+            return await self._extract_structured_data()
+
+    async def _extract_structured_data(self) -> Optional[Dict[str, Any]]:
+        """Run one extraction (caller holds _extraction_lock)."""
+        logger.info("🔍 [EXTRACTION] Starting data extraction from %d conversation entries", len(self.conversation_history))
 
         if len(self.conversation_history) < 2:
             logger.warning(f"⚠️ [EXTRACTION] Not enough conversation data ({len(self.conversation_history)} entries)")
             self._log_event("extraction_skipped", reason="insufficient_history", entries=len(self.conversation_history))
             return self.latest_structured
 
-        # Build transcript text
-        transcript_text = "\n".join(
-            f"{turn['role'].capitalize()}: {turn['text']}"
-            for turn in self.conversation_history
-        )
+        # Nothing new since the last successful extraction - reuse it
+        if self._history_version == self._last_extraction_version and self.latest_structured is not None:
+            logger.info("⏭️ [EXTRACTION] Conversation unchanged since last extraction - using cached data")
+            return self.latest_structured
 
-        logger.info(f"📝 [EXTRACTION] Built transcript ({len(transcript_text)} chars):")
-        logger.info(f"--- TRANSCRIPT START ---\n{transcript_text[:500]}{'...' if len(transcript_text) > 500 else ''}\n--- TRANSCRIPT END ---")
-
-        # Prompt for data extraction - MATCHES FRONTEND EXACTLY
-        prompt = (
-            "You are a medical data extraction assistant. "
-            "Extract structured medical intake information from this conversation. "
-            "Return ONLY valid JSON with EXACTLY these fields:\n"
-            "{\n"
-            '  "chief_complaint": "main health issue",\n'
-            '  "current_medications": [{"name": "med name", "dose": "dosage", "frequency": "how often"}],\n'
-            '  "allergies": [{"allergen": "substance", "reaction": ["symptom1", "symptom2"], "severity": "mild"}],\n'
-            '  "past_medical_history": {"conditions": ["condition1"], "surgeries": ["surgery1"], "hospitalizations": ["hospital1"]},\n'
-            '  "social_history": {"smoking": "status", "alcohol": "status", "occupation": "job"}\n'
-            "}\n"
-            "IMPORTANT:\n"
-            '- Use "current_medications" NOT "medications"\n'
-            '- Use "past_medical_history" NOT "medical_history"\n'
-            '- allergies.reaction must be ARRAY of strings like ["hives", "rash"], NOT single string\n'
-            '- allergies.severity must be one of: "mild", "moderate", "serious", "life-threatening"\n'
-            "- If information not mentioned, use empty arrays [] or empty strings\n\n"
-            f"Conversation:\n{transcript_text}"
-        )
+        # Build transcript text (lines were formatted as turns were recorded)
+        transcript_text = "\n".join(self._transcript_lines)
+
+        logger.info("📝 [EXTRACTION] Built transcript (%d chars)", len(transcript_text))
+        logger.debug("--- TRANSCRIPT START ---\n%.500s%s\n--- TRANSCRIPT END ---",
+                     transcript_text, "..." if len(transcript_text) > 500 else "")
+
+        # Prompt for data extraction (constant head + this transcript)
+        prompt = _EXTRACTION_PROMPT_HEAD + transcript_text
+        history_version = self._history_version
 
         try:
-            logger.info(f"🤖 [EXTRACTION] Calling Gemini model: {SUMMARY_MODEL}")
+            logger.info("🤖 [EXTRACTION] Calling Gemini model: %s", SUMMARY_MODEL)
             self._log_event("extraction_started", entries=len(self.conversation_history))
 
             # Call Gemini WITHOUT schema constraint - just ask for JSON
@@ -957,20 +1692,36 @@ class GeminiLiveSession:
                 )
             )
 
-            logger.info(f"✅ [EXTRACTION] Received response from model: {response.text[:200]}...")
-
-            # Parse as raw JSON - NO PYDANTIC VALIDATION
-            import json
-            self.latest_structured = json.loads(response.text)
-
-            logger.info(f"✅ [EXTRACTION] Successfully extracted data:")
-            logger.info(f"   - Chief Complaint: {self.latest_structured.get('chief_complaint', 'N/A')}")
-            logger.info(f"   - Current Medications: {len(self.latest_structured.get('current_medications', []))} items")
-            logger.info(f"   - Allergies: {len(self.latest_structured.get('allergies', []))} items")
-            past_med = self.latest_structured.get('past_medical_history', {})
-            logger.info(f"   - Past Medical History: {len(past_med.get('conditions', []))} conditions, {len(past_med.get('surgeries', []))} surgeries")
-            logger.info(f"   - Full data: {json.dumps(self.latest_structured, indent=2)}")
+            # .parsed is only filled in when a response_schema is set; use it
+            # if present and skip JSON parsing altogether
+            parsed = response.parsed
+            if isinstance(parsed, dict):
+                self.latest_structured = parsed
+            else:
+                # response.text is a property that joins the candidate's text
+                # parts on every access - read it once
+                raw = response.text
+                logger.debug("✅ [EXTRACTION] Received response from model: %.200s...", raw)
+
+                # Parse as raw JSON - NO PYDANTIC VALIDATION (orjson takes
+                # str directly, no encode needed)
+                self.latest_structured = orjson.loads(raw)
+
+            if logger.isEnabledFor(logging.INFO):
+                past_med = self.latest_structured.get('past_medical_history', {})
+                logger.info(
+                    "✅ [EXTRACTION] Successfully extracted data: chief_complaint=%s, "
+                    "current_medications=%d, allergies=%d, past_medical_history=%d conditions/%d surgeries",
+                    self.latest_structured.get('chief_complaint', 'N/A'),
+                    len(self.latest_structured.get('current_medications', [])),
+                    len(self.latest_structured.get('allergies', [])),
+                    len(past_med.get('conditions', [])),
+                    len(past_med.get('surgeries', [])),
+                )
+            # Full dump only at DEBUG (formatted lazily by the handler)
+            logger.debug("   - Full data: %s", self.latest_structured)
 
+            self._last_extraction_version = history_version
             self._log_event("extraction_success", keys=list(self.latest_structured.keys()))
             return self.latest_structured
 
@@ -1007,13 +1758,11 @@ class GeminiLiveSession:
             extracted_data: Structured medical data (optional)
         """
         try:
-            # Create storage directory if it doesn't exist
             storage_path = settings.CONVERSATION_STORAGE_PATH
-            os.makedirs(storage_path, exist_ok=True)
 
             # Generate timestamp and session ID
-            timestamp = datetime.utcnow().isoformat() + "Z"
-            session_id = f"{int(datetime.utcnow().timestamp())}"
+            timestamp = _utc_timestamp()
+            session_id = f"{int(time.time())}"
 
             # Build file data
             file_data = {
@@ -1021,7 +1770,7 @@ class GeminiLiveSession:
                 "clinic": f"{settings.CLINIC_NAME} - {settings.SPECIALTY}",
                 "voice_model": settings.VOICE_MODEL,
                 "greeting_style": settings.GREETING_STYLE,
-                "conversation": self.conversation_history,
+                "conversation": list(self.conversation_history),
                 "extracted_data": extracted_data or {},
                 "session_id": session_id
             }
@@ -1030,9 +1779,10 @@ class GeminiLiveSession:
             filename = f"intake_{timestamp.replace(':', '-').replace('.', '-')}_{session_id}.json"
             filepath = os.path.join(storage_path, filename)
 
-            # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(file_data, f, indent=2, ensure_ascii=False)
+            # file_data is a snapshot taken on the loop; directory creation,
+            # serialization and the write all run on a worker thread so disk
+            # latency never blocks the event loop (and the audio tasks)
+            await asyncio.to_thread(self._save_conversation_to_file_sync, filepath, file_data)
 
             logger.info(f"💾 Conversation saved to: {filepath}")
 
@@ -1040,55 +1790,17 @@ class GeminiLiveSession:
             logger.error(f"Failed to save conversation to file: {e}", exc_info=True)
             # Don't raise - file persistence shouldn't break the flow
 
-    def _get_system_instruction(self) -> str:
-        """
-        Get the system instruction for Gemini
-
-        This defines the AI's behavior, personality, and conversation structure.
-        Uses configuration variables for branding and tone.
-
-        Returns:
-            str: System instruction text with branding
-        """
-        # Determine greeting tone based on style
-        greeting_tones = {
-            "warm": "Be warm, empathetic, and caring in your tone",
-            "professional": "Maintain a professional and clinical tone throughout",
-            "friendly": "Be friendly, approachable, and conversational"
-        }
-        tone = greeting_tones.get(settings.GREETING_STYLE, greeting_tones["warm"])
-
-        return f"""You are an intelligent front-desk intake coordinator for {settings.CLINIC_NAME} - {settings.SPECIALTY} Department.
-
-Primary Mission:
-- Move the queue quickly by collecting accurate info that busy doctors need.
-- Sound like a professional receptionist: efficient, courteous, but never a clinician.
-- NEVER give medical advice, diagnoses, or treatment suggestions. Redirect such questions back to the doctor's visit.
-
-CONVERSATION STYLE:
-- {tone}
-- Keep questions short and clear; focus on one item at a time.
-- Politely cut off long stories and steer back to the checklist.
-- Confirm key facts (especially allergies) but avoid chit-chat.
-
-REQUIRED INFORMATION (in order):
-1. Chief complaint + goal of visit (why they're here today).
-2. Symptom basics: location, duration, severity (just headline facts for doctor).
-3. Current medications (names, doses, frequency) or clearly note "none".
-4. Allergies (substance + reaction + severity). Double-check accuracy.
-5. Past medical/surgical history or hospitalizations relevant to today.
-6. Social snapshot: smoking, alcohol, occupation, exercise if relevant.
-
-COMPLETION PROTOCOL:
-1. Give a concise receptionist-style summary (max 3 sentences) that doctors can scan fast.
-2. Ask the patient to confirm it is correct and if anything essential is missing.
-3. Once the patient confirms, immediately call complete_intake(). Do not delay or ask new questions afterward.
-4. If the patient asks for medical guidance, respond: "I'm here to capture details for your doctor; they’ll review and advise you shortly."
-
-EXAMPLE SUMMARY:
-"Here’s what I’ll share with your doctor: follow-up visit for [complaint], pain level [severity] for [duration], meds: [list or 'none'], allergies: [list or 'none'], history highlights: [key items]. Does that look right?"
+    @staticmethod
+    def _save_conversation_to_file_sync(filepath: str, file_data: Dict[str, Any]) -> None:
+        """Blocking half of _save_conversation_to_file (runs in a worker thread)."""
+        path = Path(filepath)
+        # orjson emits UTF-8 bytes directly; one write_bytes() opens, writes, closes
+        path.write_bytes(orjson.dumps(file_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
-Wait for a "yes" or equivalent, then say "Great, I’ll get this ready for the doctor now." and call complete_intake(). Keep everything brisk and focused on prepping the doctor."""
+    @staticmethod
+    def _get_system_instruction() -> str:
+        """Get the system instruction for Gemini (see _build_system_instruction)"""
+        return _build_system_instruction()
 
     async def cleanup(self):
         """
@@ -1109,7 +1821,27 @@ Wait for a "yes" or equivalent, then say "Great, I’ll get this ready for the d
                 await session.cleanup()
         """
         logger.info("Cleaning up session")
-        self._log_event("session_cleanup")
+        self._log_audio_stats()
+        self._log_event("session_cleanup", frontend_queue_stalls=self._frontend_queue_stalls)
+        # The final complete_intake() extraction feeds the audit record, so
+        # give it a bounded chance to finish before anything is cancelled
+        intake = self._intake_task
+        if intake is not None and not intake.done():
+            _, pending = await asyncio.wait({intake}, timeout=5)
+            if pending:
+                logger.error("Final extraction did not finish within 5s; saving last extraction")
+        # The frontend is gone; in-flight extractions have nowhere to report
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        # Let pending conversation saves finish (bounded) - they're the audit record
+        if self._save_tasks:
+            _, pending = await asyncio.wait(set(self._save_tasks), timeout=5)
+            if pending:
+                logger.error("%d conversation save(s) did not finish within 5s; abandoned",
+                             len(pending))
+        await self._close_session_log()
         if self.session:
             self.session = None
         # Queues will be garbage collected automatically
@@ -31,7 +31,7 @@ Endpoints:
 
 Usage:
 ------
-    uvicorn main:app --reload --host 0.0.0.0 --port 8000
+    uvicorn main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --ws-per-message-deflate false
 
 Environment Variables:
 ---------------------
@@ -48,7 +48,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import logging
 
-from gemini_live import GeminiLiveSession
+from gemini_live import GeminiLiveSession, get_shared_client
 from config import settings
 
 # ============================================================================
@@ -78,10 +78,11 @@ app = FastAPI(
 # ============================================================================
 # Enable CORS for frontend (Next.js) to connect
 # Configured via .env CORS_ORIGINS setting
+# The middleware only tests `origin in allow_origins`, so hand it the frozenset
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=settings.CORS_ORIGINS_SET,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -282,8 +283,10 @@ async def websocket_endpoint(websocket: WebSocket, api_key: str = None):
     logger.info(f"Using API key: {'from query parameter' if api_key else 'from environment'}")
 
     # Create a new Gemini Live session for this connection
-    # Each WebSocket connection gets its own isolated session
-    session = GeminiLiveSession(api_key=final_api_key)
+    # Each WebSocket connection gets its own isolated session; sessions on
+    # the server's key share one genai client, query-parameter keys don't
+    client = None if api_key else get_shared_client(final_api_key)
+    session = GeminiLiveSession(api_key=final_api_key, client=client)
 
     try:
         # Run the session - this blocks until disconnection or error
@@ -328,7 +331,7 @@ if __name__ == "__main__":
         python3 main.py
 
     Or use uvicorn directly:
-        uvicorn main:app --reload --host 0.0.0.0 --port 8000
+        uvicorn main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --ws-per-message-deflate false
 
     Configuration is loaded from .env file via settings
     """
@@ -341,5 +344,10 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=True,  # Auto-reload on code changes (development only)
         log_level=settings.LOG_LEVEL.lower(),
-        loop="asyncio"
+        # "auto" selects uvloop (libuv) when installed - uvicorn[standard]
+        # ships it on Linux/macOS - and falls back to asyncio elsewhere
+        loop="auto",
+        # PCM audio frames are effectively incompressible; per-message deflate
+        # only burns CPU on every frame in both directions
+        ws_per_message_deflate=False
     )
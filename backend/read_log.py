@@ -0,0 +1,66 @@
+"""
+Session Log Reader
+==================
+
+Prints a session log as one JSON object per line, whichever format it
+was written in:
+
+- session_*.log : NDJSON (default) - printed as-is
+- session_*.mpk : length-prefixed msgpack (SESSION_LOG_BINARY=true) - each
+                  record is a 4-byte big-endian length followed by the
+                  msgpack payload; requires the msgpack package
+
+Usage:
+    python read_log.py session_logs/session_20251113T223045_abc123.mpk
+    python read_log.py session_logs/*.log | jq .event
+"""
+
+import sys
+from typing import Any, BinaryIO, Dict, Iterator
+
+import orjson
+
+
+def iter_msgpack_records(fh: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Stream-decode length-prefixed msgpack records from a binary file."""
+    import msgpack
+
+    while True:
+        header = fh.read(4)
+        if not header:
+            return
+        if len(header) < 4:
+            raise ValueError("Truncated record header at end of log")
+        size = int.from_bytes(header, "big")
+        payload = fh.read(size)
+        if len(payload) < size:
+            raise ValueError("Truncated record at end of log")
+        yield msgpack.unpackb(payload, raw=False)
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield every record of a session log, detecting the format from its first byte."""
+    with open(path, "rb") as fh:
+        first = fh.peek(1)[:1] if hasattr(fh, "peek") else b""
+        if first == b"{":
+            for line in fh:
+                if line.strip():
+                    yield orjson.loads(line)
+        else:
+            yield from iter_msgpack_records(fh)
+
+
+def main(argv: list) -> int:
+    if not argv:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    out = sys.stdout.buffer
+    for path in argv:
+        for record in iter_records(path):
+            out.write(orjson.dumps(record) + b"\n")
+    out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
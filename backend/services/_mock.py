@@ -0,0 +1,40 @@
+"""
+Shared helpers for the mock services
+"""
+
+import asyncio
+from typing import Optional
+
+from config import settings
+
+# Base simulated latency in seconds (0 disables the sleeps entirely)
+_MOCK_DELAY = settings.MOCK_LATENCY_MS / 1000.0
+
+
+async def mock_delay(scale: float = 1.0) -> None:
+    """Simulate one backend round trip of MOCK_LATENCY_MS * scale"""
+    if _MOCK_DELAY:
+        await asyncio.sleep(_MOCK_DELAY * scale)
+
+
+class ServicePool:
+    """
+    Bounds concurrent in-flight calls into one backend, the way a
+    connection pool would. Use as ``async with self._pool:`` around the
+    actual I/O only, so composite calls don't hold a slot while they
+    await other calls on the same service.
+    """
+
+    def __init__(self, size: int = 0):
+        self._size = size or settings.SERVICE_POOL_SIZE
+        # Created on first use so it binds to the running loop, not the
+        # import-time one (services are module-level singletons)
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> None:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._size)
+        await self._sem.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._sem.release()
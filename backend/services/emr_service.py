@@ -1,17 +1,67 @@
-import asyncio
-from typing import Dict, Optional
+import time
+from collections import defaultdict
+from itertools import count
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
+from ._mock import ServicePool, mock_delay
+
 logger = logging.getLogger(__name__)
 
+# Tie-breaker for record IDs minted in the same nanosecond
+_seq = count(1)
+
 
 class EMRService:
     """Mock EMR (Electronic Medical Records) service"""
 
     def __init__(self):
+        # Caps concurrent calls into the (simulated) backend
+        self._pool = ServicePool()
         # Simulate an in-memory database
         self.records = {}
+        # Secondary indexes for search_patient: normalized key -> record IDs
+        self._by_name = defaultdict(set)
+        self._by_dob = defaultdict(set)
+        self._by_phone = defaultdict(set)
+
+    @staticmethod
+    def _index_keys(data: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Normalized (name, dob, phone) search keys for a record's data
+
+        Intake payloads can be partial or oddly shaped (no patient_info,
+        numeric phone, ...); any value that isn't a usable string gets a
+        None key and is simply left out of that index.
+        """
+        info = data.get("patient_info") if isinstance(data, dict) else None
+        if not isinstance(info, dict):
+            return None, None, None
+
+        name = info.get("name")
+        dob = info.get("date_of_birth")
+        phone = info.get("phone")
+        return (
+            (name.strip().casefold() or None) if isinstance(name, str) else None,
+            (dob.strip() or None) if isinstance(dob, str) else None,
+            ("".join(ch for ch in phone if ch.isdigit()) or None) if isinstance(phone, str) else None,
+        )
+
+    def _index_record(self, record_id: str, data: Dict) -> None:
+        for index, key in zip((self._by_name, self._by_dob, self._by_phone),
+                              self._index_keys(data)):
+            if key:
+                index[key].add(record_id)
+
+    def _unindex_record(self, record_id: str, data: Dict) -> None:
+        for index, key in zip((self._by_name, self._by_dob, self._by_phone),
+                              self._index_keys(data)):
+            ids = index.get(key) if key else None
+            if ids is not None:
+                ids.discard(record_id)
+                if not ids:
+                    del index[key]
 
     async def save_intake(self, intake_data: Dict) -> Dict:
         """
@@ -24,19 +74,48 @@ class EMRService:
             Dict with status, record_id, and message
         """
         # Simulate API delay
-        await asyncio.sleep(0.1)
+        async with self._pool:
+            await mock_delay()
+
+        result = self._store_intake(intake_data, datetime.now().isoformat())
+
+        logger.info("Saved intake to EMR: %s", result['record_id'])
+
+        return result
+
+    async def save_intakes_bulk(self, intakes: List[Dict]) -> List[Dict]:
+        """
+        Save several intakes in one round trip
+
+        Args:
+            intakes: Medical intake records to save
 
+        Returns:
+            One save_intake-style result per intake, in input order
+        """
+        # One simulated API delay and one timestamp for the whole batch
+        async with self._pool:
+            await mock_delay()
+
+        created_at = datetime.now().isoformat()
+        results = [self._store_intake(data, created_at) for data in intakes]
+
+        logger.info("Saved %d intakes to EMR", len(results))
+
+        return results
+
+    def _store_intake(self, intake_data: Dict, created_at: str) -> Dict:
+        """Insert one intake into the mock database and its indexes"""
         # Generate record ID
-        record_id = f"EMR-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        record_id = f"EMR-{time.time_ns()}-{next(_seq)}"
 
         # Store in mock database
         self.records[record_id] = {
             "data": intake_data,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "status": "active"
         }
-
-        logger.info(f"Saved intake to EMR: {record_id}")
+        self._index_record(record_id, intake_data)
 
         return {
             "status": "success",
@@ -54,7 +133,8 @@ class EMRService:
         Returns:
             Dict with patient history
         """
-        await asyncio.sleep(0.1)
+        async with self._pool:
+            await mock_delay()
 
         # Mock patient history
         mock_history = {
@@ -70,7 +150,7 @@ class EMRService:
             "last_updated": datetime.now().isoformat()
         }
 
-        logger.info(f"Retrieved patient history for: {patient_id}")
+        logger.info("Retrieved patient history for: %s", patient_id)
 
         return mock_history
 
@@ -85,13 +165,17 @@ class EMRService:
         Returns:
             Dict with update status
         """
-        await asyncio.sleep(0.1)
+        async with self._pool:
+            await mock_delay()
 
         if record_id in self.records:
-            self.records[record_id]["data"].update(updates)
+            data = self.records[record_id]["data"]
+            self._unindex_record(record_id, data)
+            data.update(updates)
+            self._index_record(record_id, data)
             self.records[record_id]["updated_at"] = datetime.now().isoformat()
 
-            logger.info(f"Updated EMR record: {record_id}")
+            logger.info("Updated EMR record: %s", record_id)
 
             return {
                 "status": "success",
@@ -99,7 +183,7 @@ class EMRService:
                 "message": "Record updated successfully"
             }
         else:
-            logger.warning(f"Record not found: {record_id}")
+            logger.warning("Record not found: %s", record_id)
 
             return {
                 "status": "error",
@@ -121,19 +205,23 @@ class EMRService:
         Returns:
             Dict with search results
         """
-        await asyncio.sleep(0.2)
-
-        # Mock search results
-        results = [
-            {
-                "patient_id": "PAT-123456",
-                "name": name or "John Doe",
-                "dob": dob or "1980-01-15",
-                "phone": phone or "555-0123"
-            }
-        ]
+        async with self._pool:
+            await mock_delay(2)
+
+        if self.records and (name or dob or phone):
+            results = self._search_index(name, dob, phone)
+        else:
+            # Mock search results
+            results = [
+                {
+                    "patient_id": "PAT-123456",
+                    "name": name or "John Doe",
+                    "dob": dob or "1980-01-15",
+                    "phone": phone or "555-0123"
+                }
+            ]
 
-        logger.info(f"Patient search: {len(results)} results")
+        logger.info("Patient search: %d results", len(results))
 
         return {
             "status": "success",
@@ -141,6 +229,34 @@ class EMRService:
             "results": results
         }
 
+    def _search_index(self, name: Optional[str], dob: Optional[str],
+                      phone: Optional[str]) -> List[Dict]:
+        """Intersect the secondary indexes for every criterion given"""
+        name_key, dob_key, phone_key = self._index_keys(
+            {"patient_info": {"name": name, "date_of_birth": dob, "phone": phone}}
+        )
+        matches: Optional[Set[str]] = None
+        for index, key in ((self._by_name, name_key),
+                           (self._by_dob, dob_key),
+                           (self._by_phone, phone_key)):
+            if key is None:
+                continue
+            ids = index.get(key, set())
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+
+        results = []
+        for record_id in sorted(matches or ()):
+            info = self.records[record_id]["data"].get("patient_info") or {}
+            results.append({
+                "patient_id": record_id,
+                "name": info.get("name"),
+                "dob": info.get("date_of_birth"),
+                "phone": info.get("phone")
+            })
+        return results
+
 
 # Singleton instance
 emr_service = EMRService()
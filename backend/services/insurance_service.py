@@ -1,15 +1,87 @@
-import asyncio
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Dict, Hashable, Optional
 from datetime import datetime, timedelta
 import logging
 
+from ._mock import ServicePool, mock_delay
+
 logger = logging.getLogger(__name__)
 
+# Keeps authorization numbers unique under concurrent submissions
+_seq = count(1)
+
+# Upper bound on distinct raw provider strings remembered
+_PROVIDER_CACHE_MAX = 256
+
+# Eligibility/benefits answers are reused for this long per member
+_LOOKUP_CACHE_TTL_SECONDS = 300
+_LOOKUP_CACHE_MAX = 10_000
+
+# Benefits schedule returned by get_benefits; the same dict is shared by
+# every response, so treat it as read-only
+_BENEFITS = {
+    "office_visit": {
+        "copay": "$25",
+        "coverage": "80%"
+    },
+    "specialist_visit": {
+        "copay": "$50",
+        "coverage": "80%"
+    },
+    "emergency_room": {
+        "copay": "$250",
+        "coverage": "80%"
+    },
+    "urgent_care": {
+        "copay": "$75",
+        "coverage": "80%"
+    },
+    "lab_work": {
+        "copay": "$0",
+        "coverage": "100%"
+    },
+    "prescription": {
+        "tier1": "$10",
+        "tier2": "$30",
+        "tier3": "$60"
+    }
+}
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after ``ttl`` seconds"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
 
 class InsuranceService:
     """Mock insurance verification service"""
 
     def __init__(self):
+        # Caps concurrent calls into the (simulated) backend
+        self._pool = ServicePool()
         # Mock insurance providers
         self.providers = {
             "aetna": "Aetna",
@@ -18,6 +90,20 @@ class InsuranceService:
             "uhc": "UnitedHealthcare",
             "kaiser": "Kaiser Permanente"
         }
+        # Raw provider string -> display name
+        self._provider_cache: Dict[str, str] = {}
+        self._eligibility_cache = _TTLCache(_LOOKUP_CACHE_MAX, _LOOKUP_CACHE_TTL_SECONDS)
+        self._benefits_cache = _TTLCache(_LOOKUP_CACHE_MAX, _LOOKUP_CACHE_TTL_SECONDS)
+
+    def _provider_display_name(self, provider: str) -> str:
+        """Canonical display name for a provider as typed by the patient"""
+        name = self._provider_cache.get(provider)
+        if name is None:
+            provider_normalized = provider.lower().replace(" ", "")
+            name = self.providers.get(provider_normalized, provider.title())
+            if len(self._provider_cache) < _PROVIDER_CACHE_MAX:
+                self._provider_cache[provider] = name
+        return name
 
     async def verify_coverage(self, member_id: str, provider: str) -> Dict:
         """
@@ -30,18 +116,14 @@ class InsuranceService:
         Returns:
             Dict with coverage details
         """
-        await asyncio.sleep(0.2)
+        async with self._pool:
+            await mock_delay(2)
 
         # Mock verification
         is_active = True  # Simulate active coverage
-        provider_normalized = provider.lower().replace(" ", "")
+        provider_name = self._provider_display_name(provider)
 
-        provider_name = self.providers.get(
-            provider_normalized,
-            provider.title()
-        )
-
-        logger.info(f"Verified insurance: {provider_name} - {member_id}")
+        logger.info("Verified insurance: %s - %s", provider_name, member_id)
 
         return {
             "status": "active" if is_active else "inactive",
@@ -71,11 +153,17 @@ class InsuranceService:
         Returns:
             Dict with eligibility information
         """
-        await asyncio.sleep(0.2)
+        key = (member_id, provider, service_type)
+        cached = self._eligibility_cache.get(key)
+        if cached is not None:
+            return dict(cached)
 
-        logger.info(f"Checking eligibility: {service_type} for {member_id}")
+        async with self._pool:
+            await mock_delay(2)
 
-        return {
+        logger.info("Checking eligibility: %s for %s", service_type, member_id)
+
+        result = {
             "status": "eligible",
             "member_id": member_id,
             "provider": provider,
@@ -86,6 +174,8 @@ class InsuranceService:
             "coverage_percentage": 80,
             "checked_at": datetime.now().isoformat()
         }
+        self._eligibility_cache.set(key, result)
+        return dict(result)
 
     async def get_benefits(self, member_id: str, provider: str) -> Dict:
         """
@@ -98,42 +188,24 @@ class InsuranceService:
         Returns:
             Dict with benefits details
         """
-        await asyncio.sleep(0.2)
+        key = (member_id, provider)
+        cached = self._benefits_cache.get(key)
+        if cached is not None:
+            return dict(cached)
 
-        logger.info(f"Retrieved benefits for: {member_id}")
+        async with self._pool:
+            await mock_delay(2)
 
-        return {
+        logger.info("Retrieved benefits for: %s", member_id)
+
+        result = {
             "member_id": member_id,
             "provider": provider,
-            "benefits": {
-                "office_visit": {
-                    "copay": "$25",
-                    "coverage": "80%"
-                },
-                "specialist_visit": {
-                    "copay": "$50",
-                    "coverage": "80%"
-                },
-                "emergency_room": {
-                    "copay": "$250",
-                    "coverage": "80%"
-                },
-                "urgent_care": {
-                    "copay": "$75",
-                    "coverage": "80%"
-                },
-                "lab_work": {
-                    "copay": "$0",
-                    "coverage": "100%"
-                },
-                "prescription": {
-                    "tier1": "$10",
-                    "tier2": "$30",
-                    "tier3": "$60"
-                }
-            },
+            "benefits": _BENEFITS,
             "retrieved_at": datetime.now().isoformat()
         }
+        self._benefits_cache.set(key, result)
+        return dict(result)
 
     async def submit_pre_authorization(self, member_id: str,
                                       provider: str,
@@ -151,12 +223,16 @@ class InsuranceService:
         Returns:
             Dict with pre-authorization status
         """
-        await asyncio.sleep(0.3)
+        async with self._pool:
+            await mock_delay(3)
+
+        now = datetime.now()
+        now_iso = now.isoformat()
 
         # Generate authorization number
-        auth_number = f"AUTH-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        auth_number = f"AUTH-{time.time_ns()}-{next(_seq)}"
 
-        logger.info(f"Pre-authorization submitted: {auth_number}")
+        logger.info("Pre-authorization submitted: %s", auth_number)
 
         return {
             "status": "approved",
@@ -166,9 +242,9 @@ class InsuranceService:
             "procedure_code": procedure_code,
             "diagnosis_code": diagnosis_code,
             "approved_units": 1,
-            "valid_from": datetime.now().isoformat(),
-            "valid_until": (datetime.now() + timedelta(days=90)).isoformat(),
-            "submitted_at": datetime.now().isoformat()
+            "valid_from": now_iso,
+            "valid_until": (now + timedelta(days=90)).isoformat(),
+            "submitted_at": now_iso
         }
 
 
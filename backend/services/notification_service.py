@@ -1,17 +1,70 @@
 import asyncio
+import time
+from collections import deque
+from itertools import count, islice
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
+from ._mock import ServicePool, mock_delay
+
 logger = logging.getLogger(__name__)
 
+# Shared by email and SMS notification IDs
+_seq = count(1)
+
+# Oldest notifications are dropped past this many
+_HISTORY_MAX = 10_000
+
+# Message templates, filled with str.format per send
+_APPT_EMAIL_TMPL = """
+Dear Patient,
+
+Your appointment has been confirmed:
+
+Date: {date}
+Time: {time}
+Provider: {provider}
+
+Please arrive 15 minutes early to complete any remaining paperwork.
+
+If you need to reschedule, please call us at 555-0100.
+
+Best regards,
+Medical Intake System
+"""
+
+_APPT_SMS_TMPL = "Appointment confirmed: {date} at {time} with {provider}. Call 555-0100 to reschedule."
+
+_INTAKE_EMAIL_TMPL = """
+Dear Patient,
+
+Thank you for completing your medical intake form.
+
+Your information has been received and will be reviewed by your provider before your appointment.
+
+Summary:
+- Chief Complaint: {chief_complaint}
+- Medications: {medication_count} listed
+- Allergies: {allergy_count} listed
+
+You will receive an appointment confirmation shortly.
+
+Best regards,
+Medical Intake System
+"""
+
+_INTAKE_SMS = "Medical intake completed. You will receive appointment details soon. Thank you!"
+
 
 class NotificationService:
     """Mock notification service for SMS and email"""
 
     def __init__(self):
-        # Mock notification history
-        self.notification_history = []
+        # Caps concurrent calls into the (simulated) backend
+        self._pool = ServicePool()
+        # Mock notification history (bounded ring buffer)
+        self.notification_history = deque(maxlen=_HISTORY_MAX)
 
     async def send_email(self, to: str, subject: str,
                         body: str, cc: Optional[List[str]] = None) -> Dict:
@@ -27,9 +80,12 @@ class NotificationService:
         Returns:
             Dict with send status
         """
-        await asyncio.sleep(0.1)
+        async with self._pool:
+            await mock_delay()
 
-        notification_id = f"EMAIL-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        sent_at = now.isoformat()
+        notification_id = f"EMAIL-{time.time_ns()}-{next(_seq)}"
 
         # Store in history
         self.notification_history.append({
@@ -37,10 +93,10 @@ class NotificationService:
             "type": "email",
             "to": to,
             "subject": subject,
-            "sent_at": datetime.now().isoformat()
+            "sent_at": sent_at
         })
 
-        logger.info(f"Email sent to {to}: {subject}")
+        logger.info("Email sent to %s: %s", to, subject)
 
         return {
             "status": "sent",
@@ -48,7 +104,7 @@ class NotificationService:
             "type": "email",
             "to": to,
             "subject": subject,
-            "sent_at": datetime.now().isoformat()
+            "sent_at": sent_at
         }
 
     async def send_sms(self, to: str, message: str) -> Dict:
@@ -62,9 +118,12 @@ class NotificationService:
         Returns:
             Dict with send status
         """
-        await asyncio.sleep(0.1)
+        async with self._pool:
+            await mock_delay()
 
-        notification_id = f"SMS-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        sent_at = now.isoformat()
+        notification_id = f"SMS-{time.time_ns()}-{next(_seq)}"
 
         # Store in history
         self.notification_history.append({
@@ -72,17 +131,17 @@ class NotificationService:
             "type": "sms",
             "to": to,
             "message": message[:50],  # Truncate for logging
-            "sent_at": datetime.now().isoformat()
+            "sent_at": sent_at
         })
 
-        logger.info(f"SMS sent to {to}: {message[:30]}...")
+        logger.info("SMS sent to %s: %.30s...", to, message)
 
         return {
             "status": "sent",
             "notification_id": notification_id,
             "type": "sms",
             "to": to,
-            "sent_at": datetime.now().isoformat()
+            "sent_at": sent_at
         }
 
     async def send_appointment_confirmation(self, patient_email: str,
@@ -99,46 +158,32 @@ class NotificationService:
         Returns:
             Dict with confirmation status
         """
-        await asyncio.sleep(0.2)
-
         # Format appointment details
         date = appointment_details.get("date", "TBD")
-        time = appointment_details.get("time", "TBD")
+        appt_time = appointment_details.get("time", "TBD")  # "time" would shadow the module
         provider = appointment_details.get("provider", "Dr. Smith")
 
         # Send email
         email_subject = "Appointment Confirmation"
-        email_body = f"""
-Dear Patient,
-
-Your appointment has been confirmed:
-
-Date: {date}
-Time: {time}
-Provider: {provider}
-
-Please arrive 15 minutes early to complete any remaining paperwork.
-
-If you need to reschedule, please call us at 555-0100.
-
-Best regards,
-Medical Intake System
-"""
-
-        email_result = await self.send_email(
-            to=patient_email,
-            subject=email_subject,
-            body=email_body
-        )
+        email_body = _APPT_EMAIL_TMPL.format(date=date, time=appt_time, provider=provider)
 
         # Send SMS
-        sms_message = f"Appointment confirmed: {date} at {time} with {provider}. Call 555-0100 to reschedule."
-        sms_result = await self.send_sms(
-            to=patient_phone,
-            message=sms_message
+        sms_message = _APPT_SMS_TMPL.format(date=date, time=appt_time, provider=provider)
+
+        # Email and SMS are independent; send them concurrently
+        email_result, sms_result = await asyncio.gather(
+            self.send_email(
+                to=patient_email,
+                subject=email_subject,
+                body=email_body
+            ),
+            self.send_sms(
+                to=patient_phone,
+                message=sms_message
+            )
         )
 
-        logger.info(f"Appointment confirmation sent to {patient_email} and {patient_phone}")
+        logger.info("Appointment confirmation sent to %s and %s", patient_email, patient_phone)
 
         return {
             "status": "sent",
@@ -161,42 +206,30 @@ Medical Intake System
         Returns:
             Dict with send status
         """
-        await asyncio.sleep(0.2)
-
         # Send email
         email_subject = "Medical Intake Completed"
-        email_body = f"""
-Dear Patient,
-
-Thank you for completing your medical intake form.
-
-Your information has been received and will be reviewed by your provider before your appointment.
-
-Summary:
-- Chief Complaint: {intake_summary.get('chief_complaint', 'N/A')}
-- Medications: {len(intake_summary.get('medications', []))} listed
-- Allergies: {len(intake_summary.get('allergies', []))} listed
-
-You will receive an appointment confirmation shortly.
-
-Best regards,
-Medical Intake System
-"""
-
-        email_result = await self.send_email(
-            to=patient_email,
-            subject=email_subject,
-            body=email_body
+        email_body = _INTAKE_EMAIL_TMPL.format(
+            chief_complaint=intake_summary.get('chief_complaint', 'N/A'),
+            medication_count=len(intake_summary.get('medications', [])),
+            allergy_count=len(intake_summary.get('allergies', []))
         )
 
         # Send SMS
-        sms_message = "Medical intake completed. You will receive appointment details soon. Thank you!"
-        sms_result = await self.send_sms(
-            to=patient_phone,
-            message=sms_message
+        sms_message = _INTAKE_SMS
+
+        email_result, sms_result = await asyncio.gather(
+            self.send_email(
+                to=patient_email,
+                subject=email_subject,
+                body=email_body
+            ),
+            self.send_sms(
+                to=patient_phone,
+                message=sms_message
+            )
         )
 
-        logger.info(f"Intake completion notification sent to {patient_email}")
+        logger.info("Intake completion notification sent to %s", patient_email)
 
         return {
             "status": "sent",
@@ -219,7 +252,8 @@ Medical Intake System
         Returns:
             Dict with send status
         """
-        await asyncio.sleep(0.1)
+        async with self._pool:
+            await mock_delay()
 
         message = f"Reminder: {reminder_type.upper()} - {details}"
 
@@ -228,7 +262,7 @@ Medical Intake System
             message=message
         )
 
-        logger.info(f"Reminder sent: {reminder_type}")
+        logger.info("Reminder sent: %s", reminder_type)
 
         return result
 
@@ -242,7 +276,11 @@ Medical Intake System
         Returns:
             List of recent notifications
         """
-        return self.notification_history[-limit:]
+        history = self.notification_history
+        if limit <= 0:
+            # Same slice as the original list: 0 gives everything, -n drops the oldest n
+            return list(history)[-limit:]
+        return list(islice(history, max(0, len(history) - limit), None))
 
 
 # Singleton instance
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for the backend tests
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Backend modules import each other as top-level modules (config, services...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Mock services: no simulated latency in tests
+os.environ.setdefault("MOCK_LATENCY_MS", "0")
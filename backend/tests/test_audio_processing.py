@@ -0,0 +1,67 @@
+"""
+Audio processing tests (pure-Python and NumPy paths agree)
+"""
+
+import array
+import random
+
+import pytest
+
+from utils.audio_processing import (
+    AudioProcessor,
+    _count_loud_samples,
+    chunk_audio,
+    chunk_audio_views,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def _pcm(samples):
+    return array.array("h", samples).tobytes()
+
+
+def _reference_loud(samples, threshold):
+    return sum(1 for s in samples if abs(s) > threshold)
+
+
+@pytest.mark.parametrize("threshold", [
+    500.0, 499.5, 500.5, 0.5, 32766.9, 32767.0, -0.5, float("inf"), float("nan"),
+])
+def test_count_loud_samples_float_threshold(threshold):
+    rng = random.Random(1)
+    samples = [-32768, 32767, 0, 500, -500, 501, -501, 499, 32766, -32767]
+    samples += [rng.randint(-32768, 32767) for _ in range(500)]
+
+    assert _count_loud_samples(memoryview(_pcm(samples)), threshold) == \
+        _reference_loud(samples, threshold)
+
+
+def test_detect_silence_float_threshold_matches_int():
+    processor = AudioProcessor()
+    quiet = _pcm([100, -100] * 600 + [800] * 100)  # ~8% above 500
+    loud = _pcm([100, -100] * 600 + [800] * 200)   # ~14% above 500
+
+    assert processor.detect_silence(quiet, threshold=500.0) is True
+    assert processor.detect_silence(loud, threshold=500.0) is False
+    for pcm in (quiet, loud):
+        assert processor.detect_silence(pcm, threshold=500.0) == \
+            processor.detect_silence(pcm, threshold=500)
+
+
+def test_chunk_audio_returns_bytes():
+    data = bytes(range(256)) * 9
+    chunks = chunk_audio(data, 1000)
+
+    assert all(type(chunk) is bytes for chunk in chunks)
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 304]
+    assert b"".join(chunks) == data
+
+
+def test_chunk_audio_views_match_chunk_audio():
+    data = bytes(range(256)) * 9
+    views = chunk_audio_views(data, 1000)
+
+    assert all(isinstance(view, memoryview) for view in views)
+    assert [bytes(view) for view in views] == chunk_audio(data, 1000)
@@ -0,0 +1,63 @@
+"""
+EMRService save/search tests
+"""
+
+import asyncio
+
+import pytest
+
+from services.emr_service import EMRService
+
+
+pytestmark = pytest.mark.services
+
+
+def _save(service, intake):
+    return asyncio.run(service.save_intake(intake))
+
+
+def _search(service, **criteria):
+    return asyncio.run(service.search_patient(**criteria))
+
+
+def test_search_finds_indexed_record():
+    service = EMRService()
+    saved = _save(service, {"patient_info": {
+        "name": "Jane Roe", "date_of_birth": "1990-02-02", "phone": "(555) 012-3456"
+    }})
+
+    result = _search(service, name="jane roe", phone="555-012-3456")
+
+    assert [r["patient_id"] for r in result["results"]] == [saved["record_id"]]
+
+
+@pytest.mark.parametrize("intake", [
+    {},
+    {"patient_info": None},
+    {"patient_info": "Jane Roe"},
+    {"patient_info": {"name": None, "phone": 5550123456}},
+    {"patient_info": {"name": 42, "date_of_birth": ["1990"]}},
+    {"chief_complaint": "headache"},
+])
+def test_save_accepts_partial_records(intake):
+    service = EMRService()
+
+    saved = _save(service, intake)
+
+    assert saved["status"] == "success"
+    assert service.records[saved["record_id"]]["data"] is intake
+    # Nothing usable to index, so a search can't match it
+    assert _search(service, name="jane roe")["results"] == []
+
+
+def test_partial_record_indexes_usable_fields_only():
+    service = EMRService()
+    saved = _save(service, {"patient_info": {"name": "Bob", "phone": 5550123456}})
+
+    assert _search(service, name="BOB")["count"] == 1
+    assert _search(service, name="bob", phone="5550123456")["results"] == []
+
+    asyncio.run(service.update_patient_record(
+        saved["record_id"], {"patient_info": None}
+    ))
+    assert _search(service, name="bob")["results"] == []
@@ -0,0 +1,82 @@
+"""
+GeminiLiveSession teardown tests (no network - the model call is stubbed on the instance)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import gemini_live
+from gemini_live import GeminiLiveSession
+
+
+pytestmark = pytest.mark.unit
+
+
+class _ClosedSocket:
+    """Frontend that has already hung up."""
+
+    async def send_text(self, text):
+        raise RuntimeError("websocket closed")
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    # Settings are frozen; swap in a copy for the session module
+    patched = gemini_live.settings.model_copy(update={
+        "SAVE_CONVERSATIONS": True,
+        "CONVERSATION_STORAGE_PATH": str(tmp_path),
+    })
+    monkeypatch.setattr(gemini_live, "settings", patched)
+    return tmp_path
+
+
+def _session(extraction_delay):
+    session = GeminiLiveSession(api_key="test", client=object())
+    session.websocket = _ClosedSocket()
+    session.conversation_history.append({"role": "patient", "text": "I have a headache"})
+    session.latest_structured = {"chief_complaint": "headache (partial)"}
+
+    async def slow_extraction(wait=True):
+        await asyncio.sleep(extraction_delay)
+        return {"chief_complaint": "headache"}
+
+    session._generate_structured_data = slow_extraction
+    return session
+
+
+def _run_disconnect_during_extraction(extraction_delay):
+    async def scenario():
+        session = _session(extraction_delay)
+        await session._handle_fn_out((None, "complete_intake"))
+        await asyncio.sleep(0)  # extraction is now in flight
+        await session.cleanup()
+
+    asyncio.run(scenario())
+
+
+def _saved(storage):
+    files = list(storage.glob("intake_*.json"))
+    assert len(files) == 1
+    return json.loads(files[0].read_bytes())
+
+
+def test_cleanup_waits_for_final_extraction_and_saves(storage):
+    _run_disconnect_during_extraction(0.05)
+
+    saved = _saved(storage)
+    assert saved["extracted_data"] == {"chief_complaint": "headache"}
+    assert saved["conversation"] == [{"role": "patient", "text": "I have a headache"}]
+
+
+def test_cancelled_final_extraction_saves_last_extraction(storage, monkeypatch):
+    real_wait = asyncio.wait
+
+    async def short_wait(fs, timeout=None, **kwargs):
+        return await real_wait(fs, timeout=0.01 if timeout else timeout, **kwargs)
+
+    monkeypatch.setattr(asyncio, "wait", short_wait)
+    _run_disconnect_during_extraction(10)
+
+    assert _saved(storage)["extracted_data"] == {"chief_complaint": "headache (partial)"}
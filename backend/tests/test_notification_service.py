@@ -0,0 +1,62 @@
+"""
+NotificationService history tests (slice semantics of the original list)
+"""
+
+import asyncio
+
+import pytest
+
+from services.notification_service import NotificationService
+
+
+pytestmark = pytest.mark.services
+
+
+@pytest.fixture
+def service():
+    svc = NotificationService()
+    svc.notification_history.extend({"id": i} for i in range(5))
+    return svc
+
+
+@pytest.mark.parametrize("limit", [0, -1, -2, -5, -9, 1, 3, 5, 10])
+def test_history_matches_list_slice(service, limit):
+    expected = list(service.notification_history)[-limit:]
+
+    assert service.get_notification_history(limit) == expected
+
+
+def test_history_limit_zero_returns_everything(service):
+    assert [n["id"] for n in service.get_notification_history(0)] == [0, 1, 2, 3, 4]
+
+
+def test_history_negative_limit_drops_oldest(service):
+    assert [n["id"] for n in service.get_notification_history(-2)] == [2, 3, 4]
+
+
+def test_history_default_is_most_recent(service):
+    assert [n["id"] for n in service.get_notification_history(2)] == [3, 4]
+
+
+def test_appointment_confirmation_formats_time(service, monkeypatch):
+    sent = []
+
+    async def fake_email(to, subject, body, cc=None):
+        sent.append(body)
+        return {"status": "sent"}
+
+    async def fake_sms(to, message):
+        sent.append(message)
+        return {"status": "sent"}
+
+    monkeypatch.setattr(service, "send_email", fake_email)
+    monkeypatch.setattr(service, "send_sms", fake_sms)
+
+    result = asyncio.run(service.send_appointment_confirmation(
+        "patient@example.com", "5551234567",
+        {"date": "2025-01-02", "time": "10:30 AM", "provider": "Dr. Lee"},
+    ))
+
+    assert result["status"] == "sent"
+    assert len(sent) == 2
+    assert all("10:30 AM" in text and "2025-01-02" in text for text in sent)
@@ -0,0 +1,70 @@
+"""
+Validator tests (results must not depend on which optional engines are installed)
+"""
+
+import pytest
+
+from utils import validators
+from utils.validators import (
+    validate_critical_allergies,
+    validate_critical_allergies_batch,
+    validate_email,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("email", ["a@b.co", "first.last+tag@mail.example.org"])
+def test_validate_email_accepts(email):
+    assert validate_email(email) == (True, None)
+
+
+@pytest.mark.parametrize("email", [
+    "a@b.co\n",      # stdlib "$" would have matched before the newline
+    "a@b.co\r\n",
+    "\na@b.co",
+    "a@b.c",
+    "a b@c.co",
+    "a@b.co trailing",
+])
+def test_validate_email_rejects(email):
+    assert validate_email(email) == (False, "Invalid email format")
+
+
+@pytest.fixture(params=["scalar", "numpy"])
+def batch_backend(request, monkeypatch):
+    """Run validate_critical_allergies_batch with and without NumPy."""
+    if request.param == "numpy":
+        monkeypatch.setattr(validators, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(validators, "np", None)
+    return request.param
+
+
+def _allergy(severity, allergen="peanuts", reaction="hives"):
+    return {"allergen": allergen, "reaction": reaction, "severity": severity}
+
+
+def test_allergy_batch_matches_scalar_on_mixed_types(batch_backend):
+    patients = [
+        [_allergy("MILD"), _allergy("Life-Threatening"), _allergy("mild ")],
+        [_allergy(None), _allergy(""), _allergy(0), _allergy(False), _allergy([])],
+        [_allergy("mild\x00"), _allergy("severe"), {"allergen": "latex"}, {}],
+        [_allergy("serious", allergen=None, reaction=0)],
+        [],
+        None,
+    ]
+
+    expected = [validate_critical_allergies(allergies) for allergies in patients]
+
+    assert validate_critical_allergies_batch(patients) == expected
+
+
+def test_allergy_batch_non_string_severity_fails_like_scalar(batch_backend):
+    patients = [[_allergy("mild")], [_allergy(5)]]
+
+    with pytest.raises(AttributeError):
+        validate_critical_allergies(patients[1])
+    with pytest.raises(AttributeError):
+        validate_critical_allergies_batch(patients)
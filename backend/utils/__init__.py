@@ -10,7 +10,8 @@ from .audio_processing import (
     audio_processor,
     AudioProcessor,
     validate_audio_format,
-    chunk_audio
+    chunk_audio,
+    chunk_audio_views
 )
 
 from .validators import (
@@ -23,7 +24,11 @@ from .validators import (
     validate_insurance_member_id,
     sanitize_text_input,
     validate_medical_record_completeness,
-    validate_critical_allergies
+    validate_critical_allergies,
+    validate_critical_allergies_batch,
+    validate_intake_record,
+    validate_allergy_records,
+    AllergyRecord
 )
 
 __all__ = [
@@ -32,6 +37,7 @@ __all__ = [
     'AudioProcessor',
     'validate_audio_format',
     'chunk_audio',
+    'chunk_audio_views',
 
     # Validators
     'validate_phone_number',
@@ -44,4 +50,8 @@ __all__ = [
     'sanitize_text_input',
     'validate_medical_record_completeness',
     'validate_critical_allergies',
+    'validate_critical_allergies_batch',
+    'validate_intake_record',
+    'validate_allergy_records',
+    'AllergyRecord',
 ]
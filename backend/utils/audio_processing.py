@@ -4,12 +4,29 @@ Audio processing utilities for medical intake application
 Handles audio format conversion, validation, and processing
 """
 
-import struct
+import array
 import logging
-from typing import Optional, Tuple
+import math
+import sys
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+try:  # Optional: vectorized sample loops (falls back to pure Python)
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is not a hard dependency
+    np = None
+
+try:  # Optional: single-pass JIT kernels on top of numpy
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is not a hard dependency
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# detect_silence scans in blocks of this many samples so it can stop as
+# soon as the 10% loud-sample verdict is settled either way
+_SILENCE_BLOCK_SAMPLES = 1024
+
 
 class AudioProcessor:
     """
@@ -37,6 +54,10 @@ class AudioProcessor:
         self.channels = channels
         self.sample_width = sample_width
 
+        # Constant per instance; get_audio_duration runs per chunk
+        self._bytes_per_frame = sample_width * channels
+        self._inv_sample_rate = 1.0 / sample_rate
+
     def validate_audio_chunk(self, audio_data: bytes) -> bool:
         """
         Validate audio chunk format
@@ -53,7 +74,7 @@ class AudioProcessor:
 
         # Check if size is divisible by sample width
         if len(audio_data) % self.sample_width != 0:
-            logger.warning(f"Invalid audio chunk size: {len(audio_data)}")
+            logger.warning("Invalid audio chunk size: %d", len(audio_data))
             return False
 
         return True
@@ -66,15 +87,13 @@ class AudioProcessor:
             audio_data: Raw audio bytes
 
         Returns:
-            Duration in seconds
+            Duration in seconds (0.0 for empty or misaligned chunks)
         """
-        if not self.validate_audio_chunk(audio_data):
+        size = len(audio_data)
+        if not size or size % self.sample_width:
             return 0.0
 
-        num_samples = len(audio_data) // (self.sample_width * self.channels)
-        duration = num_samples / self.sample_rate
-
-        return duration
+        return (size // self._bytes_per_frame) * self._inv_sample_rate
 
     def convert_to_pcm(self, audio_data: bytes) -> bytes:
         """
@@ -105,11 +124,15 @@ class AudioProcessor:
         if not self.validate_audio_chunk(audio_data):
             return audio_data
 
-        # Convert bytes to samples
-        samples = struct.unpack(f"{len(audio_data) // 2}h", audio_data)
+        if np is not None:
+            return _normalize_volume_numpy(audio_data, target_level)
+
+        # Convert bytes to samples (contiguous C shorts, no per-sample objects)
+        samples = array.array("h")
+        samples.frombytes(audio_data)
 
         # Find max amplitude
-        max_amplitude = max(abs(s) for s in samples)
+        max_amplitude = max(map(abs, samples))
 
         if max_amplitude == 0:
             return audio_data
@@ -119,13 +142,10 @@ class AudioProcessor:
         factor = target_amplitude / max_amplitude
 
         # Normalize samples
-        normalized_samples = [int(s * factor) for s in samples]
+        normalized_samples = array.array("h", [int(s * factor) for s in samples])
 
         # Convert back to bytes
-        normalized_data = struct.pack(f"{len(normalized_samples)}h",
-                                     *normalized_samples)
-
-        return normalized_data
+        return normalized_samples.tobytes()
 
     def detect_silence(self, audio_data: bytes,
                       threshold: int = 500) -> bool:
@@ -142,16 +162,23 @@ class AudioProcessor:
         if not self.validate_audio_chunk(audio_data):
             return True
 
-        # Convert bytes to samples
-        samples = struct.unpack(f"{len(audio_data) // 2}h", audio_data)
-
-        # Count samples above threshold
-        loud_samples = sum(1 for s in samples if abs(s) > threshold)
+        if np is not None:
+            return _detect_silence_numpy(audio_data, threshold)
 
-        # Consider silent if less than 10% of samples are loud
-        silence_ratio = loud_samples / len(samples)
+        # Count samples above threshold; consider silent if less than 10%
+        # of samples are loud
+        view = memoryview(audio_data)
+        total = len(audio_data) // 2
+        loud_samples = 0
+        for start in range(0, total, _SILENCE_BLOCK_SAMPLES):
+            end = start + _SILENCE_BLOCK_SAMPLES
+            loud_samples += _count_loud_samples(view[2 * start:2 * end], threshold)
+            if loud_samples / total >= 0.1:
+                return False  # already loud enough
+            if (loud_samples + max(0, total - end)) / total < 0.1:
+                return True  # can't reach 10% even if the rest is loud
 
-        return silence_ratio < 0.1
+        return loud_samples / total < 0.1
 
     def resample_audio(self, audio_data: bytes,
                       source_rate: int,
@@ -172,7 +199,7 @@ class AudioProcessor:
 
         # For this mock implementation, we just return the original
         # In a real application, you would use a library like scipy or librosa
-        logger.warning(f"Resampling not implemented: {source_rate} -> {target_rate}")
+        logger.warning("Resampling not implemented: %s -> %s", source_rate, target_rate)
 
         return audio_data
 
@@ -197,6 +224,126 @@ class AudioProcessor:
         }
 
 
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _normalize_int16(arr_in, arr_out, target_level):
+        """Peak-find, then scale-and-saturate into arr_out; returns the peak."""
+        peak = 0
+        for i in range(arr_in.size):
+            v = abs(np.int32(arr_in[i]))
+            if v > peak:
+                peak = v
+        if peak == 0:
+            return 0
+
+        factor = (32767 * target_level) / peak
+        for i in range(arr_in.size):
+            v = int(arr_in[i] * factor)
+            if v > 32767:
+                v = 32767
+            elif v < -32768:
+                v = -32768
+            arr_out[i] = v
+        return peak
+else:
+    _normalize_int16 = None
+
+
+def _normalize_volume_numpy(audio_data: bytes, target_level: float) -> bytes:
+    """NumPy version of AudioProcessor.normalize_volume.
+
+    Same output for target_level <= 1.0; above that, samples saturate at
+    the int16 range instead of overflowing.
+    """
+    if _normalize_int16 is not None:
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        out = np.empty_like(samples)
+        if _normalize_int16(samples, out, target_level) == 0:
+            return audio_data
+        return out.tobytes()
+
+    # int32 so abs(-32768) doesn't wrap around in int16
+    samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.int32)
+    peak = int(np.abs(samples).max())
+    if peak == 0:
+        return audio_data
+
+    factor = (32767 * target_level) / peak
+    # astype() truncates toward zero, matching int(s * factor)
+    return (samples * factor).clip(-32768, 32767).astype(np.int16).tobytes()
+
+
+_popcount = getattr(int, "bit_count", None) or (lambda v: bin(v).count("1"))
+
+
+@lru_cache(maxsize=8)
+def _swar_masks(lanes: int, threshold: int) -> Tuple[int, int, int, int]:
+    """Per-lane constants for _count_loud_samples, replicated across `lanes`."""
+    ones = int.from_bytes(b"\x01\x00" * lanes, "little")
+    return (
+        0x8000 * ones,                  # lane sign bits
+        0x7FFF * ones,                  # lane low 15 bits
+        (threshold + 32769) * ones,     # biased sample >= this: s > threshold
+        (32768 - threshold) * ones,     # biased sample < this: s < -threshold
+    )
+
+
+def _count_loud_samples(block, threshold: float) -> int:
+    """Count int16 samples in `block` with abs(s) > threshold, without numpy.
+
+    Loads the whole block as one Python int and compares all 16-bit lanes
+    at once (SWAR), so CPython does a handful of big-int ops per block
+    instead of a loop iteration per sample.
+    """
+    # Lane math needs an int; for integer samples abs(s) > t is the same
+    # test as abs(s) > floor(t), so float thresholds keep their meaning
+    try:
+        lane_threshold = math.floor(threshold)
+    except (TypeError, ValueError, OverflowError):  # nan, inf, odd types
+        lane_threshold = None
+
+    if lane_threshold is None or not 0 <= lane_threshold <= 32766:
+        samples = array.array("h")
+        samples.frombytes(block)
+        return sum(1 for s in samples if abs(s) > threshold)
+
+    high, low, above, below = _swar_masks(len(block) // 2, lane_threshold)
+
+    def lanes_ge(x: int, y: int) -> int:
+        # Unsigned x >= y per lane, reported in each lane's top bit; the
+        # subtraction can't borrow across lanes (x|high >= 0x8000 > y&low)
+        t = (x | high) - (y & low)
+        return ((x & ~y) | (~(x ^ y) & t)) & high
+
+    # Flip sign bits: two's-complement lanes become s + 32768 (unsigned)
+    biased = int.from_bytes(block, sys.byteorder) ^ high
+    loud = lanes_ge(biased, above) | (lanes_ge(biased, below) ^ high)
+    return _popcount(loud)
+
+
+def _detect_silence_numpy(audio_data: bytes, threshold: int) -> bool:
+    """NumPy version of AudioProcessor.detect_silence (one pass, no list)."""
+    samples = np.frombuffer(audio_data, dtype=np.int16)
+    if samples.size == 0:
+        return True
+    total = samples.size
+    if total <= _SILENCE_BLOCK_SAMPLES:
+        # Typical streaming chunk: one pass is cheaper than block bookkeeping
+        # Two-sided compare instead of abs(): abs(-32768) wraps in int16
+        loud_samples = int(np.count_nonzero((samples > threshold) | (samples < -threshold)))
+        return loud_samples / total < 0.1
+
+    loud_samples = 0
+    for start in range(0, total, _SILENCE_BLOCK_SAMPLES):
+        block = samples[start:start + _SILENCE_BLOCK_SAMPLES]
+        loud_samples += int(np.count_nonzero((block > threshold) | (block < -threshold)))
+        if loud_samples / total >= 0.1:
+            return False
+        if (loud_samples + max(0, total - start - block.size)) / total < 0.1:
+            return True
+    return loud_samples / total < 0.1
+
+
 # Default processor instance
 audio_processor = AudioProcessor()
 
@@ -228,7 +375,7 @@ def validate_audio_format(audio_data: bytes,
     return True, None
 
 
-def chunk_audio(audio_data: bytes, chunk_size: int = 1024) -> list:
+def chunk_audio(audio_data: bytes, chunk_size: int = 1024) -> List[bytes]:
     """
     Split audio into chunks
 
@@ -237,12 +384,26 @@ def chunk_audio(audio_data: bytes, chunk_size: int = 1024) -> list:
         chunk_size: Size of each chunk in bytes
 
     Returns:
-        List of audio chunks
+        List of audio chunks (slices of audio_data, so bytes in, bytes out)
     """
-    chunks = []
+    return [audio_data[i:i + chunk_size] for i in range(0, len(audio_data), chunk_size)]
 
-    for i in range(0, len(audio_data), chunk_size):
-        chunk = audio_data[i:i + chunk_size]
-        chunks.append(chunk)
 
-    return chunks
+def chunk_audio_views(audio_data: bytes, chunk_size: int = 1024) -> List[memoryview]:
+    """
+    Split audio into zero-copy chunks
+
+    Like chunk_audio, but each chunk is a memoryview over audio_data: no
+    bytes are copied, and every chunk keeps the whole source buffer alive.
+    Views can't be hashed or concatenated with +; call bytes() on a chunk
+    where an owned copy is needed.
+
+    Args:
+        audio_data: Raw audio bytes
+        chunk_size: Size of each chunk in bytes
+
+    Returns:
+        List of memoryview chunks over audio_data
+    """
+    view = memoryview(audio_data)
+    return [view[i:i + chunk_size] for i in range(0, len(view), chunk_size)]
@@ -5,12 +5,63 @@ Provides validation functions for medical data fields
 """
 
 import re
-from typing import Optional, Tuple
+import string
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+try:  # Optional: columnar batch allergy validation
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is not a hard dependency
+    np = None
+
+try:  # Optional: linear-time RE2 engine for the email pattern
+    import re2
+except ImportError:  # pragma: no cover - google-re2 is not a hard dependency
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# RFC 5321 limit; also bounds backtracking in the stdlib email regex
+_EMAIL_MAX_LENGTH = 254
+
+# Every character str.isspace() (and so regex \s) accepts
+_WHITESPACE = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
+# Deletion tables for str.translate (character-class stripping without regex)
+_PHONE_STRIP = str.maketrans('', '', _WHITESPACE + '-().')
+# ASCII subset of the same separators, for bytes.translate on ASCII input
+_PHONE_SEP_BYTES = ''.join(c for c in _WHITESPACE + '-().' if c.isascii()).encode('ascii')
+_MEMBER_STRIP = str.maketrans('', '', _WHITESPACE + '-')
+_CTRL_STRIP = dict.fromkeys(list(range(0x00, 0x20)) + list(range(0x7f, 0xa0)))
+# The part of _CTRL_STRIP an ASCII string can contain
+_ASCII_CTRL_DEL = bytes(range(0x20)) + b'\x7f'
+# Deletes every allowed medication-name character; valid names translate to ''
+_MED_NAME_ALLOWED = str.maketrans('', '', string.ascii_letters + string.digits + _WHITESPACE + '-')
+_MED_NAME_ALLOWED_BYTES = ''.join(
+    c for c in string.ascii_letters + string.digits + _WHITESPACE + '-' if c.isascii()
+).encode('ascii')
+
+# Patterns compiled once at import; validators run per form field.
+# The email pattern is unanchored and applied with fullmatch(): re's "$"
+# also matches before a trailing newline and RE2's doesn't
+_EMAIL_RE = (re2 or re).compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_DIGITS_RE = re.compile(r'\d+')
+
+_ALLERGY_SEVERITIES = ("mild", "moderate", "serious", "life-threatening")
+_VALID_SEVERITIES = frozenset(_ALLERGY_SEVERITIES)
+_VALID_SEVERITIES_MSG = f"Severity must be one of: {', '.join(_ALLERGY_SEVERITIES)}"
+
+# Per-allergy error suffixes; messages are "Allergy <n>: <suffix>"
+_ERR_MISSING_ALLERGEN = "Missing allergen name"
+_ERR_MISSING_REACTION = "Missing reaction"
+_ERR_MISSING_SEVERITY = "Missing severity"
+
 
 def validate_phone_number(phone: str) -> Tuple[bool, Optional[str]]:
     """
@@ -25,8 +76,12 @@ def validate_phone_number(phone: str) -> Tuple[bool, Optional[str]]:
     if not phone:
         return False, "Phone number is required"
 
-    # Remove common separators
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone)
+    # Remove common separators; ASCII input (the normal case) takes the
+    # bytes path, which is a plain 256-entry table scan in C
+    if phone.isascii():
+        cleaned = phone.encode('ascii').translate(None, _PHONE_SEP_BYTES).decode('ascii')
+    else:
+        cleaned = phone.translate(_PHONE_STRIP)
 
     # Check if it's all digits
     if not cleaned.isdigit():
@@ -58,15 +113,49 @@ def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     if not email:
         return False, "Email is required"
 
-    # Basic email regex
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    # Cheap rejections before the regex; the length cap keeps the
+    # backtracking engine from going quadratic on crafted domains
+    if '@' not in email or len(email) > _EMAIL_MAX_LENGTH:
+        return False, "Invalid email format"
 
-    if not re.match(pattern, email):
+    # Basic email regex
+    if not _EMAIL_RE.fullmatch(email):
         return False, "Invalid email format"
 
     return True, None
 
 
+_DOB_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y")
+
+# DOB checks only need "now" to the second; reuse it for this long
+_NOW_TTL_SECONDS = 1.0
+_cached_now: datetime = datetime.now()
+_cached_now_at: float = time.monotonic()
+
+
+def _get_now() -> datetime:
+    """datetime.now(), refreshed at most once per _NOW_TTL_SECONDS"""
+    global _cached_now, _cached_now_at
+    mono = time.monotonic()
+    if mono - _cached_now_at > _NOW_TTL_SECONDS:
+        _cached_now = datetime.now()
+        _cached_now_at = mono
+    return _cached_now
+
+
+def _is_iso_date_shape(value: str) -> bool:
+    """True for exactly 'DDDD-DD-DD' with ASCII digits"""
+    return (
+        len(value) == 10
+        and value[4] == '-'
+        and value[7] == '-'
+        and value.isascii()
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+
 def validate_date_of_birth(dob: str) -> Tuple[bool, Optional[str]]:
     """
     Validate date of birth
@@ -82,22 +171,32 @@ def validate_date_of_birth(dob: str) -> Tuple[bool, Optional[str]]:
 
     # Try to parse date
     try:
-        # Support multiple formats
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
+        if _is_iso_date_shape(dob):
+            # Canonical YYYY-MM-DD: no other supported format can match this
+            # shape, so parse it with the C fromisoformat instead of strptime
             try:
-                birth_date = datetime.strptime(dob, fmt)
-                break
+                birth_date = datetime.fromisoformat(dob)
             except ValueError:
-                continue
+                return False, "Invalid date format. Use YYYY-MM-DD or MM/DD/YYYY"
         else:
-            return False, "Invalid date format. Use YYYY-MM-DD or MM/DD/YYYY"
+            # Support multiple formats
+            for fmt in _DOB_FORMATS:
+                try:
+                    birth_date = datetime.strptime(dob, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                return False, "Invalid date format. Use YYYY-MM-DD or MM/DD/YYYY"
+
+        now = _get_now()
 
         # Check if date is in the future
-        if birth_date > datetime.now():
+        if birth_date > now:
             return False, "Date of birth cannot be in the future"
 
         # Check if date is reasonable (not more than 120 years ago)
-        age_years = (datetime.now() - birth_date).days / 365.25
+        age_years = (now - birth_date).days / 365.25
         if age_years > 120:
             return False, "Date of birth seems unrealistic"
 
@@ -128,8 +227,13 @@ def validate_medication_name(medication: str) -> Tuple[bool, Optional[str]]:
     if len(medication) > 100:
         return False, "Medication name too long"
 
-    # Check for valid characters (letters, numbers, spaces, hyphens)
-    if not re.match(r'^[a-zA-Z0-9\s\-]+$', medication):
+    # Check for valid characters (letters, numbers, spaces, hyphens);
+    # ASCII names (nearly all of them) use the cheaper bytes table
+    if medication.isascii():
+        has_invalid = bool(medication.encode('ascii').translate(None, _MED_NAME_ALLOWED_BYTES))
+    else:
+        has_invalid = bool(medication.translate(_MED_NAME_ALLOWED))
+    if has_invalid:
         return False, "Medication name contains invalid characters"
 
     return True, None
@@ -148,12 +252,8 @@ def validate_allergy_severity(severity: str) -> Tuple[bool, Optional[str]]:
     if not severity:
         return False, "Severity is required"
 
-    valid_severities = ["mild", "moderate", "serious", "life-threatening"]
-
-    severity_lower = severity.lower()
-
-    if severity_lower not in valid_severities:
-        return False, f"Severity must be one of: {', '.join(valid_severities)}"
+    if severity.lower() not in _VALID_SEVERITIES:
+        return False, _VALID_SEVERITIES_MSG
 
     return True, None
 
@@ -172,12 +272,12 @@ def validate_symptom_severity(severity: str) -> Tuple[bool, Optional[str]]:
         return False, "Severity is required"
 
     # Try to extract number from string
-    numbers = re.findall(r'\d+', str(severity))
+    match = _DIGITS_RE.search(str(severity))
 
-    if not numbers:
+    if not match:
         return False, "Severity must include a number (1-10)"
 
-    level = int(numbers[0])
+    level = int(match.group())
 
     if level < 1 or level > 10:
         return False, "Severity must be between 1 and 10"
@@ -199,14 +299,14 @@ def validate_insurance_member_id(member_id: str) -> Tuple[bool, Optional[str]]:
         return False, "Member ID is required"
 
     # Remove spaces and hyphens
-    cleaned = re.sub(r'[\s\-]', '', member_id)
+    cleaned = member_id.translate(_MEMBER_STRIP)
 
     # Check length (typically 6-20 characters)
     if len(cleaned) < 6 or len(cleaned) > 20:
         return False, "Member ID must be 6-20 characters"
 
     # Check for valid characters (letters and numbers)
-    if not re.match(r'^[a-zA-Z0-9]+$', cleaned):
+    if not (cleaned.isascii() and cleaned.isalnum()):
         return False, "Member ID must contain only letters and numbers"
 
     return True, None
@@ -226,8 +326,12 @@ def sanitize_text_input(text: str, max_length: int = 500) -> str:
     if not text:
         return ""
 
-    # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+    # Remove control characters; ASCII text can only hold C0 + DEL, so it
+    # uses a bytes table, which is several times faster than the str one
+    if text.isascii():
+        sanitized = text.encode('ascii').translate(None, _ASCII_CTRL_DEL).decode('ascii')
+    else:
+        sanitized = text.translate(_CTRL_STRIP)
 
     # Trim whitespace
     sanitized = sanitized.strip()
@@ -239,7 +343,105 @@ def sanitize_text_input(text: str, max_length: int = 500) -> str:
     return sanitized
 
 
-def validate_medical_record_completeness(intake_data: dict) -> Tuple[bool, list]:
+_REQUIRED_TOP = ("patient_info", "present_illness", "allergies")  # allergies: critical
+_REQUIRED_PATIENT = ("name", "date_of_birth")
+
+
+def _missing_fields(patient_info: Any, present_illness: Any, allergies: Any) -> List[str]:
+    """Completeness check over already-fetched top-level intake values"""
+    missing_fields = [
+        field
+        for field, value in zip(_REQUIRED_TOP, (patient_info, present_illness, allergies))
+        if not value
+    ]
+
+    # Check patient info subfields
+    if patient_info:
+        for field in _REQUIRED_PATIENT:
+            if not patient_info.get(field):
+                missing_fields.append(f"patient_info.{field}")
+
+    # Check present illness
+    if present_illness and not present_illness.get("chief_complaints"):
+        missing_fields.append("present_illness.chief_complaints")
+
+    return missing_fields
+
+
+class AllergyRecord:
+    """
+    Flat, slotted view of one allergy entry
+
+    Parse allergy dicts once at the ingest boundary (from_dict) and run
+    validate_allergy_records on the result; fields are slot loads rather
+    than dict probes on every check.
+    """
+
+    __slots__ = ("allergen", "reaction", "severity")
+
+    def __init__(self, allergen: str = "", reaction: str = "", severity: str = ""):
+        self.allergen = allergen
+        self.reaction = reaction
+        self.severity = severity
+
+    @classmethod
+    def from_dict(cls, allergy: Dict[str, Any]) -> "AllergyRecord":
+        return cls(
+            allergy.get("allergen") or "",
+            allergy.get("reaction") or "",
+            allergy.get("severity") or "",
+        )
+
+    def __repr__(self) -> str:
+        return (f"AllergyRecord(allergen={self.allergen!r}, "
+                f"reaction={self.reaction!r}, severity={self.severity!r})")
+
+
+def _severity_problem(severity: Any) -> Optional[str]:
+    """Error suffix for one allergy severity (None when it is valid)"""
+    # Same check as validate_allergy_severity
+    if not severity:
+        return _ERR_MISSING_SEVERITY
+    if severity.lower() not in _VALID_SEVERITIES:
+        return _VALID_SEVERITIES_MSG
+    return None
+
+
+def _allergy_problems(allergen: Any, reaction: Any, severity: Any) -> List[str]:
+    """Error suffixes for one allergy (empty when it is valid)"""
+    problems = []
+
+    # Check required fields
+    if not allergen:
+        problems.append(_ERR_MISSING_ALLERGEN)
+
+    if not reaction:
+        problems.append(_ERR_MISSING_REACTION)
+
+    severity_problem = _severity_problem(severity)
+    if severity_problem is not None:
+        problems.append(severity_problem)
+
+    return problems
+
+
+def _allergy_errors(allergies: List[Dict[str, Any]]) -> List[str]:
+    """Critical-allergy check for a non-empty allergy list"""
+    errors: List[str] = []
+
+    for i, allergy in enumerate(allergies, 1):
+        problems = _allergy_problems(
+            allergy.get("allergen"), allergy.get("reaction"), allergy.get("severity")
+        )
+        # Format the "Allergy N: " prefix only for allergies with errors
+        if problems:
+            prefix = f"Allergy {i}: "
+            errors.extend([prefix + problem for problem in problems])
+
+    return errors
+
+
+def validate_medical_record_completeness(intake_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate if medical intake record is complete
 
@@ -249,39 +451,18 @@ def validate_medical_record_completeness(intake_data: dict) -> Tuple[bool, list]
     Returns:
         Tuple of (is_complete, list_of_missing_fields)
     """
-    required_fields = [
-        "patient_info",
-        "present_illness",
-        "allergies"  # Critical field
-    ]
-
-    missing_fields = []
-
-    for field in required_fields:
-        if field not in intake_data or not intake_data[field]:
-            missing_fields.append(field)
-
-    # Check patient info subfields
-    if "patient_info" in intake_data and intake_data["patient_info"]:
-        patient_info = intake_data["patient_info"]
-        required_patient_fields = ["name", "date_of_birth"]
-
-        for field in required_patient_fields:
-            if field not in patient_info or not patient_info[field]:
-                missing_fields.append(f"patient_info.{field}")
-
-    # Check present illness
-    if "present_illness" in intake_data and intake_data["present_illness"]:
-        present_illness = intake_data["present_illness"]
-        if not present_illness.get("chief_complaints"):
-            missing_fields.append("present_illness.chief_complaints")
+    missing_fields = _missing_fields(
+        intake_data.get("patient_info"),
+        intake_data.get("present_illness"),
+        intake_data.get("allergies"),
+    )
 
     is_complete = len(missing_fields) == 0
 
     return is_complete, missing_fields
 
 
-def validate_critical_allergies(allergies: list) -> Tuple[bool, list]:
+def validate_critical_allergies(allergies: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
     """
     Validate critical allergy information
 
@@ -291,27 +472,114 @@ def validate_critical_allergies(allergies: list) -> Tuple[bool, list]:
     Returns:
         Tuple of (all_valid, list_of_validation_errors)
     """
-    errors = []
-
     if not allergies:
         # No allergies is acceptable (patient may have none)
         return True, []
 
-    for i, allergy in enumerate(allergies):
-        # Check required fields
-        if not allergy.get("allergen"):
-            errors.append(f"Allergy {i+1}: Missing allergen name")
+    errors = _allergy_errors(allergies)
 
-        if not allergy.get("reaction"):
-            errors.append(f"Allergy {i+1}: Missing reaction")
+    is_valid = len(errors) == 0
 
-        if not allergy.get("severity"):
-            errors.append(f"Allergy {i+1}: Missing severity")
-        else:
-            is_valid, msg = validate_allergy_severity(allergy["severity"])
-            if not is_valid:
-                errors.append(f"Allergy {i+1}: {msg}")
+    return is_valid, errors
+
+
+def validate_allergy_records(records: List[AllergyRecord]) -> Tuple[bool, List[str]]:
+    """
+    Validate pre-parsed allergy records
+
+    Same result as validate_critical_allergies on the dicts the records
+    were built from.
+
+    Args:
+        records: AllergyRecord instances (see AllergyRecord.from_dict)
+
+    Returns:
+        Tuple of (all_valid, list_of_validation_errors)
+    """
+    errors: List[str] = []
+
+    for i, record in enumerate(records, 1):
+        problems = _allergy_problems(record.allergen, record.reaction, record.severity)
+        if problems:
+            prefix = f"Allergy {i}: "
+            errors.extend([prefix + problem for problem in problems])
 
     is_valid = len(errors) == 0
 
     return is_valid, errors
+
+
+def validate_intake_record(intake_data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+    """
+    Run the completeness and critical-allergy checks in one pass
+
+    Same results as validate_medical_record_completeness(intake_data) and
+    validate_critical_allergies(intake_data.get("allergies")), but each
+    top-level field is read once and the allergy list is walked once.
+
+    Args:
+        intake_data: Medical intake dictionary
+
+    Returns:
+        Tuple of (is_valid, list_of_missing_fields, list_of_allergy_errors)
+    """
+    patient_info = intake_data.get("patient_info")
+    present_illness = intake_data.get("present_illness")
+    allergies = intake_data.get("allergies")
+
+    missing_fields = _missing_fields(patient_info, present_illness, allergies)
+    allergy_errors = _allergy_errors(allergies) if allergies else []
+
+    is_valid = not missing_fields and not allergy_errors
+
+    return is_valid, missing_fields, allergy_errors
+
+
+def validate_critical_allergies_batch(
+    patients: List[List[Dict[str, Any]]]
+) -> List[Tuple[bool, List[str]]]:
+    """
+    Validate allergy lists for many patients at once
+
+    Same result as calling validate_critical_allergies per patient. With
+    NumPy installed, the rows are flattened into columns and checked with
+    vectorized masks, and error strings are built only for flagged rows.
+
+    Args:
+        patients: One list of allergy dictionaries per patient
+
+    Returns:
+        List of (all_valid, list_of_validation_errors), one per patient
+    """
+    if np is None:
+        return [validate_critical_allergies(allergies) for allergies in patients]
+
+    counts = [len(allergies) if allergies else 0 for allergies in patients]
+    rows = [allergy for allergies in patients if allergies for allergy in allergies]
+    total = len(rows)
+
+    missing_allergen = np.fromiter((not a.get("allergen") for a in rows), dtype=bool, count=total)
+    missing_reaction = np.fromiter((not a.get("reaction") for a in rows), dtype=bool, count=total)
+    # Severities go through the scalar helper, so odd types and casing get
+    # exactly validate_critical_allergies' answer; only the masks are vectorized
+    severity_problems = [_severity_problem(a.get("severity")) for a in rows]
+    bad_severity = np.fromiter((p is not None for p in severity_problems), dtype=bool, count=total)
+    flagged = missing_allergen | missing_reaction | bad_severity
+
+    # Row index -> (patient index, 1-based allergy number within the patient)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if counts else np.zeros(0, int)
+    owners = np.repeat(np.arange(len(patients)), counts)
+
+    errors: List[List[str]] = [[] for _ in patients]
+    for row in np.flatnonzero(flagged).tolist():
+        patient = int(owners[row])
+        prefix = f"Allergy {row - int(starts[patient]) + 1}: "
+        patient_errors = errors[patient]
+        if missing_allergen[row]:
+            patient_errors.append(prefix + _ERR_MISSING_ALLERGEN)
+        if missing_reaction[row]:
+            patient_errors.append(prefix + _ERR_MISSING_REACTION)
+        if bad_severity[row]:
+            patient_errors.append(prefix + severity_problems[row])
+
+    return [(not patient_errors, patient_errors) for patient_errors in errors]
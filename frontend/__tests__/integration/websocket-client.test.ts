@@ -107,4 +107,21 @@ describe('WebSocket Client', () => {
       severity: 'moderate',
     });
   });
+
+  it('should split coalesced audio frames into chunks', async () => {
+    const client = new WebSocketClient('ws://localhost:8000/ws');
+    const onAudio = vi.fn();
+    client.onAudio(onAudio);
+
+    await client.connect();
+    vi.advanceTimersByTime(100);
+
+    // 0x01 tag, then <uint32 LE length><bytes> per chunk
+    const frame = new Uint8Array([0x01, 2, 0, 0, 0, 10, 11, 4, 0, 0, 0, 20, 21, 22, 23]);
+    (client as any).ws?.simulateMessage(frame.buffer);
+
+    expect(onAudio).toHaveBeenCalledTimes(2);
+    expect(Array.from(new Uint8Array(onAudio.mock.calls[0][0]))).toEqual([10, 11]);
+    expect(Array.from(new Uint8Array(onAudio.mock.calls[1][0]))).toEqual([20, 21, 22, 23]);
+  });
 });
@@ -275,6 +275,20 @@ export class WebSocketClient {
   }
 
   private handleAudio(buffer: ArrayBuffer): void {
+    // PCM16 chunks have an even length; an odd-length frame starting with
+    // 0x01 carries several chunks, each as <uint32 LE length><bytes>
+    if (buffer.byteLength % 2 === 1 && new Uint8Array(buffer, 0, 1)[0] === 0x01) {
+      const view = new DataView(buffer);
+      let offset = 1;
+      while (offset + 4 <= buffer.byteLength) {
+        const length = view.getUint32(offset, true);
+        offset += 4;
+        this.handleAudio(buffer.slice(offset, offset + length));
+        offset += length;
+      }
+      return;
+    }
+
     console.log(`[WebSocket] 🎧 handleAudio() - Passing ${buffer.byteLength} bytes to handler`);
     if (this.onAudioHandler) {
       this.onAudioHandler(buffer);